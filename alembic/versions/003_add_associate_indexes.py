@@ -0,0 +1,32 @@
+"""Add associate indexes for level/name listing and rating lookups
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Composite index matching the rating input screen's filter and ordering
+    op.create_index(
+        'ix_assoc_level_name',
+        'associates',
+        ['associate_level_id', 'last_name', 'first_name'],
+    )
+
+    # Index for counting/updating associates by performance rating
+    op.create_index('ix_assoc_perf_rating', 'associates', ['performance_rating_id'])
+
+
+def downgrade():
+    op.drop_index('ix_assoc_perf_rating', table_name='associates')
+    op.drop_index('ix_assoc_level_name', table_name='associates')
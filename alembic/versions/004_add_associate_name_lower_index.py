@@ -0,0 +1,29 @@
+"""Add case-insensitive associate name index for CSV import lookups
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Expression index matching the importer's lower(first/last name) lookups
+    op.create_index(
+        'ix_associates_name_lower',
+        'associates',
+        [sa.text('lower(first_name)'), sa.text('lower(last_name)')],
+    )
+
+
+def downgrade():
+    op.drop_index('ix_associates_name_lower', table_name='associates')
@@ -1,5 +1,5 @@
 """Database package - exports database configuration and utilities."""
-from .config import engine, SessionLocal, init_db, get_session, get_db, DATABASE_URL
+from .config import engine, SessionLocal, init_db, get_session, get_db, data_version, DATABASE_URL
 
 __all__ = [
     "engine",
@@ -7,5 +7,6 @@ __all__ = [
     "init_db",
     "get_session",
     "get_db",
+    "data_version",
     "DATABASE_URL",
 ]
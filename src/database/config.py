@@ -1,6 +1,8 @@
 """Database configuration and session management."""
+import threading
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.pool import QueuePool
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
 
@@ -16,7 +18,13 @@ DATABASE_URL = f"sqlite:///{DB_PATH}"
 engine = create_engine(
     DATABASE_URL,
     echo=False,  # Set to True for SQL query logging during development
-    connect_args={"check_same_thread": False}  # Needed for SQLite
+    connect_args={"check_same_thread": False},  # Needed for SQLite
+    # Keep connections open between UI actions so get_db()/close() is a
+    # pool checkout/checkin rather than a new SQLite connection each time
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_timeout=30,
 )
 
 # Create session factory
@@ -27,6 +35,54 @@ SessionLocal = sessionmaker(
 )
 
 
+# Incremented after every committed transaction that wrote data
+_data_version = 0
+_data_version_lock = threading.Lock()
+
+
+def data_version() -> int:
+    """
+    Return a counter that increases after every commit that wrote data.
+
+    Screens can cache results derived from the database and reuse them
+    while this value is unchanged. Every write made through a Session
+    (ORM flushes and insert/update/delete statements alike) is counted;
+    changes made by other processes are not.
+
+    Returns:
+        int: Current data version
+    """
+    return _data_version
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _note_statement_write(orm_execute_state) -> None:
+    """Mark a session that ran an INSERT, UPDATE or DELETE statement."""
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["wrote_data"] = True
+
+
+@event.listens_for(Session, "after_flush")
+def _note_flush_write(session: Session, flush_context) -> None:
+    """Mark a session that flushed ORM changes."""
+    session.info["wrote_data"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_version(session: Session) -> None:
+    """Advance the data version once a transaction that wrote has committed."""
+    global _data_version
+    if session.info.pop("wrote_data", False):
+        with _data_version_lock:
+            _data_version += 1
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_write_mark(session: Session) -> None:
+    """Forget writes that were rolled back."""
+    session.info.pop("wrote_data", None)
+
+
 def init_db() -> None:
     """
     Initialize the database by creating all tables.
@@ -1,5 +1,5 @@
 """Associate model representing employees in the organization."""
-from sqlalchemy import Integer, String, ForeignKey, Boolean
+from sqlalchemy import Integer, String, ForeignKey, Boolean, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from typing import Optional, List
 
@@ -77,6 +77,16 @@ class Associate(Base):
         cascade="all"
     )
 
+    # Indexes
+    __table_args__ = (
+        # Backs the rating input listing (filter by level, ordered by name)
+        Index("ix_assoc_level_name", "associate_level_id", "last_name", "first_name"),
+        # Backs rating usage counts and rating-based lookups
+        Index("ix_assoc_perf_rating", "performance_rating_id"),
+        # Backs the CSV importer's case-insensitive name lookups
+        Index("ix_associates_name_lower", func.lower(first_name), func.lower(last_name)),
+    )
+
     @property
     def full_name(self) -> str:
         """Return the full name of the associate."""
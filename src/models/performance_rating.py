@@ -41,9 +41,14 @@ class PerformanceRating(Base):
     )
 
     # Relationships
+    # Never loaded implicitly: count usage with a query instead. passive_deletes
+    # keeps session.delete() from loading the collection (callers check that
+    # the rating is unused before deleting it).
     associates: Mapped[List["Associate"]] = relationship(
         "Associate",
-        back_populates="performance_rating"
+        back_populates="performance_rating",
+        lazy="raise",
+        passive_deletes=True
     )
 
     distribution_bucket: Mapped[Optional["DistributionBucket"]] = relationship(
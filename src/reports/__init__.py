@@ -3,6 +3,7 @@ from .distribution_calculator import (
     get_total_headcount,
     get_associates_by_rating,
     get_associates_by_level_and_rating,
+    calculate_rating_distribution,
     calculate_rating_distribution_percentages,
     get_unrated_associates,
     get_level_distribution_summary,
@@ -12,6 +13,7 @@ __all__ = [
     "get_total_headcount",
     "get_associates_by_rating",
     "get_associates_by_level_and_rating",
+    "calculate_rating_distribution",
     "calculate_rating_distribution_percentages",
     "get_unrated_associates",
     "get_level_distribution_summary",
@@ -0,0 +1,67 @@
+"""
+Numeric kernels for the distribution reports.
+
+When Numba is installed the loop kernels are JIT-compiled (and cached on
+disk); otherwise equivalent vectorized NumPy versions are used.
+"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional
+    njit = None
+
+
+def _classify_loops(
+    pcts: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify a rows x buckets percentage matrix against bucket target ranges.
+
+    Written as plain loops for Numba compilation.
+
+    Args:
+        pcts: float64 array of percentages shaped rows x buckets
+        mins: float64 array of bucket minimum percentages
+        maxs: float64 array of bucket maximum percentages
+
+    Returns:
+        Tuple of (codes, oor_counts) where codes is an int8 rows x buckets array
+        (0 = within range, 1 = below minimum, 2 = above maximum) and oor_counts
+        is an int32 array with the number of out-of-range cells per row
+    """
+    rows, cols = pcts.shape
+    codes = np.zeros((rows, cols), dtype=np.int8)
+    oor_counts = np.zeros(rows, dtype=np.int32)
+    for i in range(rows):
+        for j in range(cols):
+            pct = pcts[i, j]
+            if pct < mins[j]:
+                codes[i, j] = 1
+                oor_counts[i] += 1
+            elif pct > maxs[j]:
+                codes[i, j] = 2
+                oor_counts[i] += 1
+    return codes, oor_counts
+
+
+def _classify_numpy(
+    pcts: np.ndarray,
+    mins: np.ndarray,
+    maxs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized equivalent of _classify_loops, used when Numba is not installed."""
+    codes = np.where(pcts < mins, 1, np.where(pcts > maxs, 2, 0)).astype(np.int8)
+    oor_counts = np.count_nonzero(codes, axis=1).astype(np.int32)
+    return codes, oor_counts
+
+
+# classify(pcts, mins, maxs) -> (codes, oor_counts)
+if njit is not None:
+    classify = njit(cache=True)(_classify_loops)
+else:
+    classify = _classify_numpy
@@ -3,8 +3,13 @@ Distribution calculator for performance ratings.
 
 This module provides functions to calculate performance rating distributions.
 """
+import sys
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
+from operator import attrgetter
+
+import numpy as np
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import select, func
 from ..models import Associate, AssociateLevel, PerformanceRating, DistributionBucket
@@ -85,15 +90,15 @@ def get_associates_by_level_and_rating(db: Session) -> Dict[Tuple[str, str], int
     return {(row.level_desc, row.rating_desc): row.count for row in result}
 
 
-def calculate_rating_distribution_percentages(db: Session) -> Dict[str, float]:
+def calculate_rating_distribution(db: Session) -> Dict[str, Tuple[int, float]]:
     """
-    Calculate percentage distribution of performance ratings.
+    Calculate count and percentage distribution of performance ratings.
 
     Args:
         db: Database session
 
     Returns:
-        Dictionary mapping rating description to percentage (0-100)
+        Dictionary mapping rating description to (count, percentage (0-100))
     """
     total = get_total_headcount(db)
     if total == 0:
@@ -101,11 +106,25 @@ def calculate_rating_distribution_percentages(db: Session) -> Dict[str, float]:
 
     counts = get_associates_by_rating(db)
     return {
-        rating: (count / total) * 100
+        rating: (count, (count / total) * 100)
         for rating, count in counts.items()
     }
 
 
+def calculate_rating_distribution_percentages(db: Session) -> Dict[str, float]:
+    """
+    Calculate percentage distribution of performance ratings.
+
+    Args:
+        db: Database session
+
+    Returns:
+        Dictionary mapping rating description to percentage (0-100)
+    """
+    combined = calculate_rating_distribution(db)
+    return {rating: pct for rating, (_, pct) in combined.items()}
+
+
 def get_unrated_associates(db: Session) -> List[Associate]:
     """
     Get all associates who do not have a performance rating assigned.
@@ -132,9 +151,12 @@ def get_level_distribution_summary(db: Session) -> Dict[str, Dict]:
     - Percentage distribution
 
     Returns:
-        Dictionary mapping level description to summary dict
+        Dictionary mapping level description to summary dict, ordered by
+        level indicator
     """
-    levels = db.execute(select(AssociateLevel)).scalars().all()
+    levels = db.execute(
+        select(AssociateLevel).order_by(AssociateLevel.level_indicator)
+    ).scalars().all()
     summary = {}
 
     for level in levels:
@@ -197,11 +219,13 @@ class BucketDistribution:
 
     # Ratings included in this bucket
     rating_breakdown: Dict[str, int]  # rating_description -> count
+    rating_breakdown_sorted: List[Tuple[str, int]]  # (rating_description, count) sorted by description
 
     # Status indicators
     is_below_minimum: bool
     is_above_maximum: bool
     is_within_target: bool
+    status_code: int  # 0 = within target, 1 = below minimum, 2 = above maximum
 
 
 @dataclass
@@ -225,6 +249,17 @@ class DistributionResult:
     # Bucket distributions
     bucket_distributions: List[BucketDistribution]
 
+    @cached_property
+    def headcount_strings(self) -> Dict[str, str]:
+        """Headcount fields pre-converted to display strings, keyed by field name."""
+        return {
+            'total_associates': str(self.total_associates),
+            'top_level_manager_count': str(self.top_level_manager_count),
+            'excluded_rating_count': str(self.excluded_rating_count),
+            'included_in_distribution_count': str(self.included_in_distribution_count),
+            'unrated_count': str(self.unrated_count),
+        }
+
 
 def calculate_comprehensive_distribution(db: Session) -> DistributionResult:
     """
@@ -341,6 +376,7 @@ def calculate_bucket_distributions(
         is_below_minimum = percentage < bucket.min_percentage
         is_above_maximum = percentage > bucket.max_percentage
         is_within_target = not (is_below_minimum or is_above_maximum)
+        status_code = 1 if is_below_minimum else (2 if is_above_maximum else 0)
 
         bucket_results.append(BucketDistribution(
             bucket_id=bucket.id,
@@ -352,9 +388,11 @@ def calculate_bucket_distributions(
             count=bucket_count,
             percentage=percentage,
             rating_breakdown=rating_breakdown,
+            rating_breakdown_sorted=sorted(rating_breakdown.items()),
             is_below_minimum=is_below_minimum,
             is_above_maximum=is_above_maximum,
-            is_within_target=is_within_target
+            is_within_target=is_within_target,
+            status_code=status_code
         ))
 
     return bucket_results
@@ -462,13 +500,29 @@ class ManagerDistributionDetail:
     rating_counts: Dict[str, int]  # rating_description -> count
     rating_percentages: Dict[str, float]  # rating_description -> percentage
 
-    # Bucket distributions (for included reports only)
+    # Bucket distributions (for included reports only); percentages are
+    # held on the report as ManagerDistributionReport.bucket_pcts
     bucket_counts: Dict[str, int]  # bucket_name -> count
-    bucket_percentages: Dict[str, float]  # bucket_name -> percentage
 
     # Status indicators for buckets
     buckets_out_of_range: List[str]  # List of bucket names that are out of target range
 
+    # This manager's row of the report's bucket_pcts array and its column
+    # names, set by calculate_manager_distributions
+    _bucket_pcts: Optional[np.ndarray] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _bucket_names: Optional[List[str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def bucket_percentages(self) -> Dict[str, float]:
+        """bucket_name -> percentage for every bucket, empty if no included reports."""
+        if not self.included_reports or self._bucket_pcts is None:
+            return {}
+        return dict(zip(self._bucket_names, self._bucket_pcts.tolist()))
+
 
 @dataclass
 class ManagerDistributionReport:
@@ -478,11 +532,21 @@ class ManagerDistributionReport:
     total_managers: int
     total_associates_under_managers: int
 
-    # Individual manager details
+    # Individual manager details, sorted by hierarchy level then name
     manager_details: List[ManagerDistributionDetail]
 
+    # Bucket percentages (included reports only) for every manager as one
+    # manager x bucket array. Rows follow manager_details, columns follow
+    # bucket_names (bucket sort order); managers with no included reports
+    # have a row of zeros. The target range of each column is carried
+    # alongside, as it was when the report was calculated.
+    bucket_names: List[str]
+    bucket_min_pcts: np.ndarray
+    bucket_max_pcts: np.ndarray
+    bucket_pcts: np.ndarray
+
     # Hierarchy level summaries
-    hierarchy_summaries: Dict[int, Dict]  # hierarchy_level -> summary dict
+    hierarchy_summaries: Dict[int, Dict]  # hierarchy_level -> summary dict, in level order
 
 
 def calculate_hierarchy_level(db: Session, associate: Associate) -> int:
@@ -498,25 +562,44 @@ def calculate_hierarchy_level(db: Session, associate: Associate) -> int:
         db: Database session
         associate: Associate to calculate level for
 
+    Returns:
+        Hierarchy level (0 = top)
+    """
+    # One query for every reporting line instead of one per level
+    manager_ids = dict(db.execute(select(Associate.id, Associate.manager_id)).all())
+    manager_ids[associate.id] = associate.manager_id
+    return _hierarchy_level(manager_ids, associate.id)
+
+
+def _hierarchy_level(manager_ids: Dict[int, Optional[int]], associate_id: int) -> int:
+    """
+    Calculate an associate's hierarchy level from in-memory reporting lines.
+
+    Used directly when calculating levels for many associates, so the
+    reporting lines are only loaded once; see calculate_hierarchy_level.
+
+    Args:
+        manager_ids: Mapping of every associate id to its manager_id
+        associate_id: Associate to calculate level for
+
     Returns:
         Hierarchy level (0 = top)
     """
     level = 0
-    current = associate
+    current_id = associate_id
+    manager_id = manager_ids[current_id]
 
     # Prevent infinite loops in case of circular references
     seen_ids = set()
 
-    while current.manager_id is not None:
-        if current.manager_id in seen_ids:
+    while manager_id is not None:
+        if manager_id in seen_ids:
             # Circular reference detected
             break
-        seen_ids.add(current.id)
+        seen_ids.add(current_id)
 
-        # Get the manager
-        current = db.execute(
-            select(Associate).where(Associate.id == current.manager_id)
-        ).scalar_one()
+        current_id = manager_id
+        manager_id = manager_ids[current_id]
         level += 1
 
     return level
@@ -536,92 +619,121 @@ def calculate_manager_distributions(db: Session) -> ManagerDistributionReport:
     Returns:
         ManagerDistributionReport with comprehensive manager distribution data
     """
-    # Get all associates who are people managers
+    # Get all associates who are people managers (only the columns the
+    # report needs, not full ORM objects with their direct reports)
     managers = db.execute(
-        select(Associate)
+        select(
+            Associate.id,
+            Associate.first_name,
+            Associate.last_name,
+            AssociateLevel.description.label('level_desc'),
+        )
+        .join(AssociateLevel, Associate.associate_level_id == AssociateLevel.id)
         .where(Associate.is_people_manager.is_(True))
-        .options(joinedload(Associate.direct_reports))
-    ).unique().scalars().all()
+        .order_by(Associate.id)
+    ).all()
 
     # Get all buckets for reference
     buckets = db.execute(
         select(DistributionBucket).order_by(DistributionBucket.sort_order)
     ).scalars().all()
-    bucket_map = {b.id: b for b in buckets}
+
+    # Interned so the per-manager bucket_counts lookups compare by identity;
+    # in sort order they also label the columns of the bucket_pcts array
+    bucket_names = {b.id: sys.intern(b.name) for b in buckets}
+
+    # Reporting lines for every associate, used to walk hierarchy levels in memory
+    manager_ids = dict(db.execute(select(Associate.id, Associate.manager_id)).all())
+
+    # Direct report counts per (manager, rating), aggregated in the database.
+    # Unrated reports come back with a NULL rating.
+    report_counts = db.execute(
+        select(
+            Associate.manager_id,
+            PerformanceRating.description,
+            PerformanceRating.excluded_from_distribution,
+            PerformanceRating.distribution_bucket_id,
+            func.count(Associate.id).label('count')
+        )
+        .outerjoin(
+            PerformanceRating,
+            Associate.performance_rating_id == PerformanceRating.id
+        )
+        .where(Associate.manager_id.isnot(None))
+        .group_by(Associate.manager_id, Associate.performance_rating_id)
+    ).all()
+    counts_by_manager = {}  # manager_id -> list of grouped rows
+    for row in report_counts:
+        counts_by_manager.setdefault(row.manager_id, []).append(row)
 
     manager_details = []
+    pct_rows = {}  # manager_id -> bucket percentages in bucket sort order
     hierarchy_data = {}  # hierarchy_level -> list of ManagerDistributionDetail
 
     for manager in managers:
         # Calculate manager's hierarchy level
-        hierarchy_level = calculate_hierarchy_level(db, manager)
+        hierarchy_level = _hierarchy_level(manager_ids, manager.id)
 
         # Categorize direct reports
-        total_reports = len(manager.direct_reports)
-        rated_reports = []
-        unrated_reports = []
-        excluded_reports = []
-        included_reports = []
-
-        for report in manager.direct_reports:
-            if report.performance_rating_id is None:
-                unrated_reports.append(report)
-            elif report.performance_rating.excluded_from_distribution:
-                excluded_reports.append(report)
-            else:
-                rated_reports.append(report)
-                included_reports.append(report)
+        total_reports = 0
+        unrated_count = 0
+        excluded_count = 0
+        included_count = 0
 
-        # Calculate rating distributions (included only)
+        # Rating and bucket distributions (included only)
         rating_counts = {}
-        for report in included_reports:
-            rating_desc = report.performance_rating.description
-            rating_counts[rating_desc] = rating_counts.get(rating_desc, 0) + 1
+        bucket_counts = {}
+
+        for row in counts_by_manager.get(manager.id, ()):
+            total_reports += row.count
+            if row.description is None:
+                unrated_count += row.count
+            elif row.excluded_from_distribution:
+                excluded_count += row.count
+            else:
+                included_count += row.count
+                rating_counts[row.description] = row.count
+                bucket_name = bucket_names.get(row.distribution_bucket_id)
+                if bucket_name is not None:
+                    bucket_counts[bucket_name] = bucket_counts.get(bucket_name, 0) + row.count
 
         rating_percentages = {}
-        if included_reports:
+        if included_count:
             for rating, count in rating_counts.items():
-                rating_percentages[rating] = (count / len(included_reports)) * 100
+                rating_percentages[rating] = (count / included_count) * 100
 
-        # Calculate bucket distributions (included only)
-        bucket_counts = {}
-        for report in included_reports:
-            bucket_id = report.performance_rating.distribution_bucket_id
-            if bucket_id and bucket_id in bucket_map:
-                bucket_name = bucket_map[bucket_id].name
-                bucket_counts[bucket_name] = bucket_counts.get(bucket_name, 0) + 1
-
-        bucket_percentages = {}
+        pct_row = [0.0] * len(buckets)
         buckets_out_of_range = []
-        if included_reports:
-            for bucket in buckets:
-                count = bucket_counts.get(bucket.name, 0)
-                percentage = (count / len(included_reports)) * 100
-                bucket_percentages[bucket.name] = percentage
+        if included_count:
+            for j, bucket in enumerate(buckets):
+                bucket_name = bucket_names[bucket.id]
+                count = bucket_counts.get(bucket_name, 0)
+                percentage = (count / included_count) * 100
+                pct_row[j] = percentage
 
                 # Check if out of range
                 if percentage < bucket.min_percentage or percentage > bucket.max_percentage:
                     if count > 0:  # Only flag if there are actually people in this bucket
-                        buckets_out_of_range.append(bucket.name)
+                        buckets_out_of_range.append(bucket_name)
 
         detail = ManagerDistributionDetail(
             manager_id=manager.id,
-            manager_name=manager.full_name,
-            manager_level=manager.associate_level.description,
+            manager_name=f"{manager.first_name} {manager.last_name}",
+            manager_level=manager.level_desc,
             hierarchy_level=hierarchy_level,
             total_direct_reports=total_reports,
-            rated_reports=len(rated_reports),
-            unrated_reports=len(unrated_reports),
-            excluded_reports=len(excluded_reports),
-            included_reports=len(included_reports),
+            rated_reports=included_count,
+            unrated_reports=unrated_count,
+            excluded_reports=excluded_count,
+            included_reports=included_count,
             rating_counts=rating_counts,
             rating_percentages=rating_percentages,
             bucket_counts=bucket_counts,
-            bucket_percentages=bucket_percentages,
             buckets_out_of_range=buckets_out_of_range
         )
 
         manager_details.append(detail)
+        pct_rows[manager.id] = pct_row
 
         # Add to hierarchy data
         if hierarchy_level not in hierarchy_data:
@@ -630,7 +742,8 @@ def calculate_manager_distributions(db: Session) -> ManagerDistributionReport:
 
     # Calculate hierarchy level summaries
     hierarchy_summaries = {}
-    for level, details in hierarchy_data.items():
+    # Built in level order so report views can iterate it directly
+    for level, details in sorted(hierarchy_data.items()):
         # Aggregate across all managers at this level
         total_managers_at_level = len(details)
         total_included = sum(d.included_reports for d in details)
@@ -669,6 +782,17 @@ def calculate_manager_distributions(db: Session) -> ManagerDistributionReport:
             'bucket_percentages': agg_bucket_percentages
         }
 
+    # Sort once here so report views can iterate in display order
+    manager_details.sort(key=attrgetter('hierarchy_level', 'manager_name'))
+    bucket_pcts = np.array(
+        [pct_rows[d.manager_id] for d in manager_details],
+        dtype=np.float64
+    ).reshape(len(manager_details), len(buckets))
+    column_names = [bucket_names[b.id] for b in buckets]
+    for detail, row in zip(manager_details, bucket_pcts):
+        detail._bucket_pcts = row
+        detail._bucket_names = column_names
+
     # Calculate overall totals
     total_associates_under_managers = sum(d.total_direct_reports for d in manager_details)
 
@@ -676,5 +800,9 @@ def calculate_manager_distributions(db: Session) -> ManagerDistributionReport:
         total_managers=len(manager_details),
         total_associates_under_managers=total_associates_under_managers,
         manager_details=manager_details,
+        bucket_names=column_names,
+        bucket_min_pcts=np.array([b.min_percentage for b in buckets], dtype=np.float64),
+        bucket_max_pcts=np.array([b.max_percentage for b in buckets], dtype=np.float64),
+        bucket_pcts=bucket_pcts,
         hierarchy_summaries=hierarchy_summaries
     )
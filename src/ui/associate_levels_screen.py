@@ -5,10 +5,11 @@ from textual.containers import Container, Horizontal, Vertical, ScrollableContai
 from textual.widgets import Header, Footer, Button, DataTable, Static, Input, Label
 from textual.binding import Binding
 from textual.message import Message
+from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 
 from ..database import get_db
-from ..models import AssociateLevel
+from ..models import Associate, AssociateLevel
 
 
 class AssociateLevelForm(Container):
@@ -232,10 +233,14 @@ class AssociateLevelsScreen(Screen):
                 self.app.notify("Level not found", severity="error")
                 return
 
-            # Check if level is in use by any associates
-            if level.associates:
+            # Check if level is in use by any associates (a COUNT rather
+            # than loading the level's associates collection)
+            associate_count = db.query(func.count(Associate.id)).filter(
+                Associate.associate_level_id == level.id
+            ).scalar()
+            if associate_count:
                 self.app.notify(
-                    f"Cannot delete: {len(level.associates)} associate(s) have this level",
+                    f"Cannot delete: {associate_count} associate(s) have this level",
                     severity="error",
                     timeout=5,
                 )
@@ -1,12 +1,121 @@
 """Distribution Report screen."""
+from typing import Iterator, List, Tuple
+
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, ScrollableContainer
 from textual.widgets import Header, Footer, Button, DataTable, Static
 from textual.binding import Binding
+from textual.worker import get_current_worker
+
+from ..reports.distribution_calculator import (
+    BucketDistribution,
+    DistributionResult,
+    calculate_comprehensive_distribution,
+)
+
+# Separator cells for summary rows
+_SEP40 = "─" * 40
+_SEP15 = "─" * 15
+_SEP10 = "─" * 10
+
+# Rows posted to the UI thread per batch while streaming the report
+_CHUNK_SIZE = 100
+
+# Bound once so per-row percentage cells skip f-string dispatch
+_FMT_PCT = "{:.1f}%".format
+
+# Indexed by BucketDistribution.status_code
+_STATUS_SYMBOLS = ("✓ Within", "↓ Below Min", "↑ Above Max")
+
+# Cursor messages DataTable posts while rows are cleared/added. The report
+# tables have no cursor, so nothing listens for them during a refresh.
+_HIGHLIGHT_MESSAGES = (
+    DataTable.CellHighlighted,
+    DataTable.RowHighlighted,
+    DataTable.ColumnHighlighted,
+)
+
+
+def _format_warning(bucket: BucketDistribution) -> str:
+    """Format the out-of-range warning line for a bucket."""
+    if bucket.is_below_minimum:
+        return (
+            f"{bucket.bucket_name}: {bucket.percentage:.1f}% "
+            f"(below minimum {bucket.min_percentage:.1f}%)"
+        )
+    return (
+        f"{bucket.bucket_name}: {bucket.percentage:.1f}% "
+        f"(above maximum {bucket.max_percentage:.1f}%)"
+    )
+
+
+def _build_rows(result: DistributionResult) -> Tuple[List[Tuple[str, ...]], ...]:
+    """Build the display rows for the headcount, bucket, rating and excluded tables."""
+    counts = result.headcount_strings
+
+    # Section 1: Headcount Summary
+    headcount_rows = [
+        ("Total Associates", counts['total_associates']),
+        ("Top-Level Manager (excluded)", counts['top_level_manager_count']),
+        ("Excluded Ratings (e.g., 'Too New')", counts['excluded_rating_count']),
+        ("Unrated Associates", counts['unrated_count']),
+        (_SEP40, _SEP10),
+        ("Included in Distribution", counts['included_in_distribution_count']),
+    ]
 
-from ..database import get_db
-from ..reports.distribution_calculator import calculate_comprehensive_distribution
+    # Section 2: Distribution Bucket Analysis
+    bucket_rows = []
+    if not result.bucket_distributions:
+        bucket_rows.append(("No buckets configured", "-", "-", "-", "-", "-"))
+    else:
+        for bucket in result.bucket_distributions:
+            status = _STATUS_SYMBOLS[bucket.status_code]
+
+            # Build ratings breakdown string
+            ratings_str = ", ".join([
+                f"{rating}: {count}"
+                for rating, count in bucket.rating_breakdown_sorted
+            ]) or "(none)"
+
+            bucket_rows.append((
+                f"{bucket.bucket_name}\n{ratings_str}",
+                str(bucket.count),
+                _FMT_PCT(bucket.percentage),
+                _FMT_PCT(bucket.min_percentage),
+                _FMT_PCT(bucket.max_percentage),
+                status
+            ))
+
+    # Section 3: Individual Rating Distribution (Included)
+    rating_rows = []
+    if not result.rating_counts:
+        rating_rows.append(("No rated associates", "0", "0.0%"))
+    else:
+        # Sort by percentage descending
+        for rating, count in sorted(
+            result.rating_counts.items(),
+            key=lambda x: x[1],
+            reverse=True
+        ):
+            pct = result.rating_percentages.get(rating, 0.0)
+            rating_rows.append((rating, str(count), _FMT_PCT(pct)))
+
+        # Total row
+        rating_rows.append((_SEP40, _SEP10, _SEP15))
+        rating_rows.append(("TOTAL", counts['included_in_distribution_count'], "100.0%"))
+
+    # Section 4: Excluded Associates
+    excluded_rows = [("Top-Level Manager", counts['top_level_manager_count'])]
+    if result.excluded_rating_counts:
+        for rating, count in sorted(result.excluded_rating_counts.items()):
+            excluded_rows.append((rating, str(count)))
+    else:
+        excluded_rows.append(("(No excluded ratings)", "0"))
+    excluded_rows.append(("Unrated", counts['unrated_count']))
+
+    return headcount_rows, bucket_rows, rating_rows, excluded_rows
 
 
 class DistributionReportScreen(Screen):
@@ -51,158 +160,162 @@ class DistributionReportScreen(Screen):
 
     def on_mount(self) -> None:
         """Set up the data tables and load data."""
+        # Bumped by every load; chunks posted by a superseded worker are dropped
+        self._load_generation = 0
+
+        # Cache table references so refreshes don't re-run the selector queries
+        self._headcount_table = self.query_one("#headcount_table", DataTable)
+        self._buckets_table = self.query_one("#buckets_table", DataTable)
+        self._ratings_table = self.query_one("#ratings_table", DataTable)
+        self._excluded_table = self.query_one("#excluded_table", DataTable)
+
+        # Count and percentage columns use fixed widths so DataTable doesn't
+        # re-measure them for every added row; the free-text columns (bucket
+        # names with their rating breakdowns, rating descriptions) auto-size
+
         # Headcount table
-        headcount_table = self.query_one("#headcount_table", DataTable)
-        headcount_table.add_columns("Category", "Count")
+        self._headcount_table.add_column("Category")
+        self._headcount_table.add_column("Count", width=10)
 
         # Buckets table
-        buckets_table = self.query_one("#buckets_table", DataTable)
-        buckets_table.add_columns("Bucket", "Count", "Actual %", "Min %", "Max %", "Status")
+        self._buckets_table.add_column("Bucket")
+        self._buckets_table.add_column("Count", width=8)
+        self._buckets_table.add_column("Actual %", width=10)
+        self._buckets_table.add_column("Min %", width=8)
+        self._buckets_table.add_column("Max %", width=8)
+        self._buckets_table.add_column("Status")
 
         # Ratings table
-        ratings_table = self.query_one("#ratings_table", DataTable)
-        ratings_table.add_columns("Rating", "Count", "Percentage")
+        self._ratings_table.add_column("Rating")
+        self._ratings_table.add_column("Count", width=10)
+        self._ratings_table.add_column("Percentage", width=15)
 
         # Excluded table
-        excluded_table = self.query_one("#excluded_table", DataTable)
-        excluded_table.add_columns("Category", "Count")
+        self._excluded_table.add_column("Category")
+        self._excluded_table.add_column("Count", width=10)
 
         self.load_data()
 
-    def load_data(self) -> None:
-        """Load distribution data from the database."""
-        headcount_table = self.query_one("#headcount_table", DataTable)
-        buckets_table = self.query_one("#buckets_table", DataTable)
-        ratings_table = self.query_one("#ratings_table", DataTable)
-        excluded_table = self.query_one("#excluded_table", DataTable)
-
-        headcount_table.clear()
-        buckets_table.clear()
-        ratings_table.clear()
-        excluded_table.clear()
-
-        db = get_db()
+    def load_data(self, notify_refreshed: bool = False) -> None:
+        """Clear the tables and start streaming distribution data into them.
+
+        Only the four DataTables change on refresh. The Header, Footer,
+        toolbar buttons and section-header Statics are composed once and are
+        never touched here.
+
+        Args:
+            notify_refreshed: If True, show "Data refreshed" once the load completes
+        """
+        self._load_generation += 1
+        with self.app.batch_update(), self.prevent(*_HIGHLIGHT_MESSAGES):
+            for table in self._tables():
+                table.clear()
+                table.loading = True
+        self._populate_stream(self._load_generation, notify_refreshed)
+
+    def _tables(self) -> Tuple[DataTable, ...]:
+        """Return the report tables in display order."""
+        return (
+            self._headcount_table,
+            self._buckets_table,
+            self._ratings_table,
+            self._excluded_table,
+        )
+
+    @work(thread=True, exclusive=True, exit_on_error=False)
+    def _populate_stream(self, generation: int, notify_refreshed: bool) -> None:
+        """Calculate the distribution off the UI thread and stream rows into the tables.
+
+        Rows are posted back in chunks so the first rows paint before the
+        whole report has been built.
+
+        Args:
+            generation: Load generation this worker fills the tables for
+            notify_refreshed: If True, show "Data refreshed" once all rows are added
+        """
+        worker = get_current_worker()
+        db = self.app.db_session_factory()
         try:
             # Get comprehensive distribution data
             result = calculate_comprehensive_distribution(db)
 
-            # Section 1: Headcount Summary
-            headcount_table.add_row("Total Associates", str(result.total_associates))
-            headcount_table.add_row(
-                "Top-Level Manager (excluded)",
-                str(result.top_level_manager_count)
-            )
-            headcount_table.add_row(
-                "Excluded Ratings (e.g., 'Too New')",
-                str(result.excluded_rating_count)
-            )
-            headcount_table.add_row("Unrated Associates", str(result.unrated_count))
-            headcount_table.add_row("─" * 40, "─" * 10)
-            headcount_table.add_row(
-                "Included in Distribution",
-                str(result.included_in_distribution_count)
-            )
-
-            # Section 2: Distribution Bucket Analysis
-            if not result.bucket_distributions:
-                buckets_table.add_row("No buckets configured", "-", "-", "-", "-", "-")
-            else:
-                for bucket in result.bucket_distributions:
-                    # Determine status symbol
-                    if bucket.is_within_target:
-                        status = "✓ Within"
-                    elif bucket.is_below_minimum:
-                        status = "↓ Below Min"
-                    else:  # is_above_maximum
-                        status = "↑ Above Max"
-
-                    # Build ratings breakdown string
-                    ratings_str = ", ".join(
-                        f"{rating}: {count}"
-                        for rating, count in sorted(bucket.rating_breakdown.items())
-                    ) if bucket.rating_breakdown else "(none)"
-
-                    buckets_table.add_row(
-                        f"{bucket.bucket_name}\n{ratings_str}",
-                        str(bucket.count),
-                        f"{bucket.percentage:.1f}%",
-                        f"{bucket.min_percentage:.1f}%",
-                        f"{bucket.max_percentage:.1f}%",
-                        status
-                    )
-
-            # Section 3: Individual Rating Distribution (Included)
-            if not result.rating_counts:
-                ratings_table.add_row("No rated associates", "0", "0.0%")
-            else:
-                # Sort by percentage descending
-                for rating, count in sorted(
-                    result.rating_counts.items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                ):
-                    pct = result.rating_percentages.get(rating, 0.0)
-                    ratings_table.add_row(
-                        rating,
-                        str(count),
-                        f"{pct:.1f}%"
-                    )
-
-                # Total row
-                ratings_table.add_row(
-                    "─" * 40,
-                    "─" * 10,
-                    "─" * 15
-                )
-                ratings_table.add_row(
-                    "TOTAL",
-                    str(result.included_in_distribution_count),
-                    "100.0%"
-                )
-
-            # Section 4: Excluded Associates
-            excluded_table.add_row(
-                "Top-Level Manager",
-                str(result.top_level_manager_count)
-            )
+            for table, chunk, is_last in self._iter_row_chunks(result):
+                if worker.is_cancelled:
+                    return
+                self.app.call_from_thread(self._add_chunk, generation, table, chunk, is_last)
 
-            if result.excluded_rating_counts:
-                for rating, count in sorted(result.excluded_rating_counts.items()):
-                    excluded_table.add_row(rating, str(count))
-            else:
-                excluded_table.add_row("(No excluded ratings)", "0")
-
-            excluded_table.add_row("Unrated", str(result.unrated_count))
-
-            # Show validation warnings if any buckets are out of range
-            out_of_range_buckets = [
-                b for b in result.bucket_distributions
+            # Out-of-range bucket warnings, shown once the rows are in
+            warnings = [
+                _format_warning(b) for b in result.bucket_distributions
                 if not b.is_within_target
             ]
-            if out_of_range_buckets:
-                warnings = []
-                for bucket in out_of_range_buckets:
-                    if bucket.is_below_minimum:
-                        warnings.append(
-                            f"{bucket.bucket_name}: {bucket.percentage:.1f}% "
-                            f"(below minimum {bucket.min_percentage:.1f}%)"
-                        )
-                    else:
-                        warnings.append(
-                            f"{bucket.bucket_name}: {bucket.percentage:.1f}% "
-                            f"(above maximum {bucket.max_percentage:.1f}%)"
-                        )
-
-                self.app.notify(
-                    "WARNING: Some buckets are outside target ranges:\n" + "\n".join(warnings),
-                    severity="warning",
-                    timeout=10
-                )
+            self.app.call_from_thread(
+                self._load_finished, generation, warnings, notify_refreshed
+            )
 
         except Exception as e:
-            self.app.notify(f"Error loading distribution data: {str(e)}", severity="error")
+            self.app.call_from_thread(self._load_failed, generation, e)
         finally:
-            db.close()
+            # Release this worker thread's session; the main thread's session
+            # stays registered on the app
+            self.app.db_session_factory.remove()
+
+    def _add_chunk(
+        self,
+        generation: int,
+        table: DataTable,
+        chunk: List[Tuple[str, ...]],
+        is_last: bool
+    ) -> None:
+        """Append a chunk of rows to a table (runs on the UI thread).
+
+        A worker cancelled by a refresh may already have this call queued;
+        its rows belong to a superseded load and are dropped.
+        """
+        if generation != self._load_generation:
+            return
+        with self.app.batch_update(), self.prevent(*_HIGHLIGHT_MESSAGES):
+            table.add_rows(chunk)
+            if is_last:
+                table.loading = False
+
+    def _load_finished(
+        self,
+        generation: int,
+        warnings: List[str],
+        notify_refreshed: bool
+    ) -> None:
+        """Report bucket warnings once every row is in (runs on the UI thread)."""
+        if generation != self._load_generation:
+            return
+        if notify_refreshed:
+            self.app.notify("Data refreshed", severity="information")
+
+        # Show validation warnings if any buckets are out of range
+        if warnings:
+            self.app.notify(
+                "WARNING: Some buckets are outside target ranges:\n" + "\n".join(warnings),
+                severity="warning",
+                timeout=10
+            )
+
+    def _load_failed(self, generation: int, error: Exception) -> None:
+        """Report a load error and drop the loading indicators (runs on the UI thread)."""
+        if generation != self._load_generation:
+            return
+        for table in self._tables():
+            table.loading = False
+        self.app.notify(f"Error loading distribution data: {str(error)}", severity="error")
+
+    def _iter_row_chunks(
+        self,
+        result: DistributionResult
+    ) -> Iterator[Tuple[DataTable, List[Tuple[str, ...]], bool]]:
+        """Yield (table, rows_chunk, is_last_chunk) for every report table."""
+        for table, rows in zip(self._tables(), _build_rows(result)):
+            for start in range(0, len(rows), _CHUNK_SIZE):
+                end = start + _CHUNK_SIZE
+                yield table, rows[start:end], end >= len(rows)
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -213,8 +326,7 @@ class DistributionReportScreen(Screen):
 
     def action_refresh(self) -> None:
         """Refresh the data tables."""
-        self.load_data()
-        self.app.notify("Data refreshed", severity="information")
+        self.load_data(notify_refreshed=True)
 
     def action_back(self) -> None:
         """Go back to the main menu."""
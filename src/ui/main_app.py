@@ -4,16 +4,13 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Button, Static
 from textual.binding import Binding
 from textual.screen import Screen
+from typing import List, Tuple
 
-from ..database import init_db
-from .performance_ratings_screen import PerformanceRatingsScreen
-from .associate_levels_screen import AssociateLevelsScreen
-from .associates_screen import AssociatesScreen
-from .distribution_report_screen import DistributionReportScreen
-from .manager_distribution_screen import ManagerDistributionScreen
-from .rating_input_screen import RatingInputScreen
-from .distribution_buckets_screen import DistributionBucketsScreen
-from .csv_import_screen import CSVImportScreen
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.orm import scoped_session
+
+from ..database import init_db, engine, get_db, SessionLocal
+from ..models import PerformanceRating
 
 
 class MainMenuScreen(Screen):
@@ -53,22 +50,34 @@ class MainMenuScreen(Screen):
         yield Footer()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
-        """Handle button presses."""
+        """Handle button presses.
+
+        Screen modules are imported on first use so app startup only pays
+        for the main menu.
+        """
         if event.button.id == "btn_ratings":
+            from .performance_ratings_screen import PerformanceRatingsScreen
             self.app.push_screen(PerformanceRatingsScreen())
         elif event.button.id == "btn_buckets":
+            from .distribution_buckets_screen import DistributionBucketsScreen
             self.app.push_screen(DistributionBucketsScreen())
         elif event.button.id == "btn_levels":
+            from .associate_levels_screen import AssociateLevelsScreen
             self.app.push_screen(AssociateLevelsScreen())
         elif event.button.id == "btn_associates":
+            from .associates_screen import AssociatesScreen
             self.app.push_screen(AssociatesScreen())
         elif event.button.id == "btn_import_csv":
+            from .csv_import_screen import CSVImportScreen
             self.app.push_screen(CSVImportScreen())
         elif event.button.id == "btn_input_ratings":
+            from .rating_input_screen import RatingInputScreen
             self.app.push_screen(RatingInputScreen())
         elif event.button.id == "btn_reports":
+            from .distribution_report_screen import DistributionReportScreen
             self.app.push_screen(DistributionReportScreen())
         elif event.button.id == "btn_manager_reports":
+            from .manager_distribution_screen import ManagerDistributionScreen
             self.app.push_screen(ManagerDistributionScreen())
 
 
@@ -85,8 +94,48 @@ class PerformanceManagementApp(App):
     def on_mount(self) -> None:
         """Initialize the database when the app starts."""
         init_db()
+        # App-scoped session registry; screens borrow the same session for
+        # read-only report queries instead of building a new one per refresh
+        self.db_session_factory = scoped_session(SessionLocal)
+        # (id, description, level_indicator) per rating, loaded on first use
+        self._ratings_cache = None
         self.push_screen(MainMenuScreen())
 
+    def get_ratings(self) -> List[Tuple[int, str, int]]:
+        """Return all performance ratings ordered by level indicator.
+
+        Ratings only change on the Performance Ratings screen, so they are
+        loaded once and cached as plain tuples until invalidate_ratings()
+        is called.
+
+        Returns:
+            List of (id, description, level_indicator) tuples
+        """
+        if self._ratings_cache is None:
+            db = get_db()
+            try:
+                self._ratings_cache = [
+                    tuple(row) for row in db.execute(lambda_stmt(
+                        lambda: select(
+                            PerformanceRating.id,
+                            PerformanceRating.description,
+                            PerformanceRating.level_indicator,
+                        ).order_by(PerformanceRating.level_indicator)
+                    )).all()
+                ]
+            finally:
+                db.close()
+        return self._ratings_cache
+
+    def invalidate_ratings(self) -> None:
+        """Drop the cached ratings after ratings are added, edited or deleted."""
+        self._ratings_cache = None
+
+    def on_unmount(self) -> None:
+        """Release the app-scoped database session and pooled connections on shutdown."""
+        self.db_session_factory.remove()
+        engine.dispose()
+
     def action_quit(self) -> None:
         """Quit the application."""
         self.exit()
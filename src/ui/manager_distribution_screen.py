@@ -1,15 +1,103 @@
 """Manager Distribution Report screen."""
+import threading
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+from textual import work
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, ScrollableContainer
 from textual.widgets import Header, Footer, Button, DataTable, Static
 from textual.binding import Binding
+from textual.worker import Worker, WorkerState
 
-from ..database import get_db
+from ..database import data_version, get_db
 from ..models import DistributionBucket
-from ..reports.distribution_calculator import calculate_manager_distributions
+from ..reports._distribution_kernels import classify
+from ..reports.distribution_calculator import (
+    ManagerDistributionReport,
+    calculate_manager_distributions,
+)
 from sqlalchemy import select
 
+# Bucket cell formatters indexed by status code (within, below minimum,
+# above maximum), bound once so each cell is a single C-level format call
+_CELL_FORMATS = ("{:.1f}%".format, "↓ {:.1f}%".format, "↑ {:.1f}%".format)
+
+# Last calculated report, reused while the data version is unchanged
+_MD_CACHE = {"version": None, "result": None}
+
+
+def _stage_bucket_percentages(
+    bucket_percentages: List[Dict[str, float]],
+    names: List[str],
+) -> np.ndarray:
+    """Stage per-row bucket_name -> percentage dicts into a rows x buckets array."""
+    return np.fromiter(
+        (bp.get(name, 0.0) for bp in bucket_percentages for name in names),
+        dtype=np.float64,
+        count=len(bucket_percentages) * len(names),
+    ).reshape(len(bucket_percentages), len(names))
+
+
+def _classify_bucket_cells(
+    pcts: np.ndarray,
+    result: ManagerDistributionReport,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Classify every cell of a rows x buckets percentage array.
+
+    Args:
+        pcts: Percentages shaped rows x buckets, columns in the report's bucket order
+        result: Report whose bucket target ranges the cells are checked against
+
+    Returns:
+        Tuple of (codes, oor_counts) where codes is shaped rows x buckets
+        (0 = within range, 1 = below minimum, 2 = above maximum) and
+        oor_counts holds out-of-range cells per row
+    """
+    return classify(pcts, result.bucket_min_pcts, result.bucket_max_pcts)
+
+
+def _bucket_columns(bucket_ranges: Iterable[Tuple[str, float, float]]) -> List[str]:
+    """Build one column header per (name, min, max) bucket showing its target range."""
+    return [f"{name}\n({lo:.0f}-{hi:.0f}%)" for name, lo, hi in bucket_ranges]
+
+
+def _fill_bucket_cells(
+    row_buf: List[str],
+    start: int,
+    pcts: np.ndarray,
+    codes: np.ndarray,
+    cell_cache: Dict[Tuple[int, float], str]
+) -> None:
+    """Write one row of formatted bucket cells into a row buffer.
+
+    Args:
+        row_buf: Row buffer to fill in place
+        start: Index of the first bucket column in row_buf
+        pcts: Percentages for one row
+        codes: Status codes for the same row
+        cell_cache: (code, pct) -> cell text, shared across rows so each
+            distinct cell is only formatted once
+    """
+    for j, key in enumerate(zip(codes.tolist(), pcts.tolist()), start):
+        text = cell_cache.get(key)
+        if text is None:
+            text = cell_cache[key] = _CELL_FORMATS[key[0]](key[1])
+        row_buf[j] = text
+
+
+@dataclass
+class _ManagerReportRows:
+    """Pre-formatted rows for the manager report tables."""
+
+    bucket_columns: List[str]  # Bucket column headers for the report's buckets
+    summary_rows: List[Tuple[str, ...]]
+    manager_rows: List[Tuple[str, ...]]
+    hierarchy_rows: List[Tuple[str, ...]]
+    issues_count: int  # Managers with buckets outside target ranges
+
 
 class ManagerDistributionScreen(Screen):
     """Screen for viewing manager-level performance rating distributions."""
@@ -54,175 +142,376 @@ class ManagerDistributionScreen(Screen):
 
     def on_mount(self) -> None:
         """Set up the data tables and load data."""
+        # One session for the life of the screen, reused by every refresh.
+        # The lock keeps a refresh from using it while a cancelled worker
+        # thread is still finishing with it.
+        self._session = get_db()
+        self._session_lock = threading.Lock()
+        self._closing = False
+
+        # Buckets rarely change, so load them once and build the bucket
+        # columns here rather than on every refresh
+        with self._session_lock:
+            try:
+                self._buckets = self._session.execute(
+                    select(DistributionBucket).order_by(DistributionBucket.sort_order)
+                ).scalars().all()
+            finally:
+                self._release_session()
+
+        # Headers until a report arrives; each report brings its own
+        self._bucket_columns = _bucket_columns(
+            (b.name, b.min_percentage, b.max_percentage) for b in self._buckets
+        )
+
+        # Rows for tables that haven't been scrolled into view yet
+        self._pending_rows = {}
+        self._container = self.query_one(".screen-container", ScrollableContainer)
+        self.watch(self._container, "scroll_y", self._load_visible_tables, init=False)
+
         # Summary table
         summary_table = self.query_one("#summary_table", DataTable)
         summary_table.add_columns("Metric", "Value")
 
-        self.load_data()
-
-    def load_data(self) -> None:
-        """Load manager distribution data from the database."""
-        summary_table = self.query_one("#summary_table", DataTable)
-        hierarchy_table = self.query_one("#hierarchy_table", DataTable)
+        # Managers table: manager info + one column per bucket + status
         managers_table = self.query_one("#managers_table", DataTable)
+        managers_table.add_columns(*self._build_manager_columns())
 
-        summary_table.clear()
-        hierarchy_table.clear()
-        managers_table.clear()
-
-        db = get_db()
-        try:
-            # Get distribution buckets (ordered)
-            buckets = db.execute(
-                select(DistributionBucket).order_by(DistributionBucket.sort_order)
-            ).scalars().all()
+        # Hierarchy table
+        hierarchy_table = self.query_one("#hierarchy_table", DataTable)
+        hierarchy_table.add_columns(*self._build_hierarchy_columns())
 
-            if not buckets:
-                self.app.notify("No distribution buckets configured", severity="warning")
-                return
+        # A DataTable sets its virtual size once it has measured newly added
+        # rows, which can move the tables below it; that is only reflected
+        # in table positions after the next layout
+        for table in (managers_table, hierarchy_table):
+            self.watch(table, "virtual_size", self._schedule_visibility_check, init=False)
 
-            # Get manager distribution data
-            result = calculate_manager_distributions(db)
+        self.load_data()
 
-            # Section 1: Overall Summary
-            summary_table.add_row("Total Managers", str(result.total_managers))
-            summary_table.add_row(
+    def _build_manager_columns(self) -> List[str]:
+        """Build the column headers for the individual managers table."""
+        return [
+            "Manager", "Hier.\nLevel", "Total\nReports", "Incl.\nReports",
+            *self._bucket_columns,
+            "Status",
+        ]
+
+    def _build_hierarchy_columns(self) -> List[str]:
+        """Build the column headers for the hierarchy level table."""
+        return [
+            "Hierarchy\nLevel", "Managers", "Total\nIncluded",
+            *self._bucket_columns,
+            "Status",
+        ]
+
+    def load_data(self, force: bool = False, notify_refreshed: bool = False) -> None:
+        """Clear the tables and start calculating the report in a worker.
+
+        Args:
+            force: If True, recalculate even when the cached report is still fresh
+            notify_refreshed: If True, show "Data refreshed" once the load completes
+        """
+        tables = self._tables()
+        self._pending_rows = {}
+        self._notify_refreshed = notify_refreshed
+        for table in tables:
+            table.clear(columns=False)
+
+        if not self._buckets:
+            self.app.notify("No distribution buckets configured", severity="warning")
+            return
+
+        for table in tables:
+            table.loading = True
+        self._compute_data(force)
+
+    def _tables(self) -> Tuple[DataTable, DataTable, DataTable]:
+        """Return the summary, managers and hierarchy tables."""
+        return (
+            self.query_one("#summary_table", DataTable),
+            self.query_one("#managers_table", DataTable),
+            self.query_one("#hierarchy_table", DataTable),
+        )
+
+    def _release_session(self) -> None:
+        """End the screen session's read transaction between loads.
+
+        Ending the transaction returns the connection to the pool and drops
+        SQLite's shared lock, so edits made on other screens aren't blocked
+        and the next refresh reads current data. Loaded objects are detached
+        first so they stay readable instead of being expired.
+        """
+        self._session.expunge_all()
+        self._session.rollback()
+
+    def on_unmount(self) -> None:
+        """Cancel any running load and close the screen's database session."""
+        self._closing = True
+        self.workers.cancel_node(self)
+        self._close_session()
+
+    def _close_session(self) -> None:
+        """Close the screen's session unless a worker is still using it.
+
+        Never waits for the lock, so leaving the screen doesn't freeze the UI
+        while a calculation finishes; a worker that still holds the session
+        closes it itself once done (see _compute_data).
+        """
+        if self._session_lock.acquire(blocking=False):
+            try:
+                self._session.close()
+            finally:
+                self._session_lock.release()
+
+    @work(thread=True, exclusive=True, exit_on_error=False)
+    def _compute_data(self, force: bool) -> _ManagerReportRows:
+        """Calculate the report and format its rows off the UI thread.
+
+        Args:
+            force: If True, recalculate even when the cached report is still fresh
+
+        Returns:
+            _ManagerReportRows ready to be added to the tables
+        """
+        try:
+            with self._session_lock:
+                db = self._session
+                try:
+                    # Get manager distribution data, reusing the cached report
+                    # if nothing has been written since it was calculated. The
+                    # version is read first, so a commit that lands
+                    # mid-calculation makes the next visit recalculate.
+                    version = data_version()
+                    if not force and _MD_CACHE["version"] == version:
+                        result = _MD_CACHE["result"]
+                    else:
+                        result = calculate_manager_distributions(db)
+                        _MD_CACHE["version"] = version
+                        _MD_CACHE["result"] = result
+                finally:
+                    self._release_session()
+        finally:
+            # Checked after the lock is released, so either this or
+            # on_unmount is sure to find the session free and close it
+            if self._closing:
+                self._close_session()
+
+        return self._build_rows(result)
+
+    def _build_rows(self, result: ManagerDistributionReport) -> _ManagerReportRows:
+        """Format the report into plain row tuples for each table.
+
+        Bucket columns and target ranges are taken from the report itself,
+        which may be a cached one calculated before the buckets last changed.
+        """
+        bucket_names = result.bucket_names
+        nbuckets = len(bucket_names)
+        no_data_cells = ("-",) * nbuckets
+        cell_cache = {}
+
+        # Section 1: Overall Summary
+        summary_rows = [
+            ("Total Managers", str(result.total_managers)),
+            (
                 "Total Associates Under Managers",
                 str(result.total_associates_under_managers)
+            ),
+        ]
+
+        # Section 2: Individual Manager Distribution by Bucket
+        manager_rows = []
+        issues_count = 0  # Managers with included reports outside target ranges
+        if not result.manager_details:
+            manager_rows.append(("No managers found",))
+        else:
+            # Already sorted by hierarchy level, then by name
+            managers = result.manager_details
+
+            pcts = result.bucket_pcts
+            codes, _ = _classify_bucket_cells(pcts, result)
+
+            # Out-of-range buckets per manager, counting only buckets that
+            # have people in them (the calculator's buckets_out_of_range rule)
+            flagged = np.count_nonzero((codes != 0) & (pcts > 0), axis=1)
+            included = np.fromiter(
+                (m.included_reports for m in managers),
+                dtype=np.int64,
+                count=len(managers),
+            )
+            issues_count = int(np.count_nonzero((flagged > 0) & (included > 0)))
+            flagged = flagged.tolist()
+
+            # Hierarchy levels are a handful of small ints, so convert each once
+            level_strs = {
+                level: str(level)
+                for level in {m.hierarchy_level for m in managers}
+            }
+
+            # One buffer reused for every row: manager info, bucket cells, status
+            row_buf = [""] * (5 + nbuckets)
+            for i, manager in enumerate(managers):
+                row_buf[0] = manager.manager_name
+                row_buf[1] = level_strs[manager.hierarchy_level]
+                row_buf[2] = str(manager.total_direct_reports)
+                row_buf[3] = str(manager.included_reports)
+
+                # Add bucket percentages, with an indicator if out of range
+                if manager.included_reports > 0:
+                    _fill_bucket_cells(row_buf, 4, pcts[i], codes[i], cell_cache)
+                else:
+                    row_buf[4:-1] = no_data_cells
+
+                # Add status column
+                if manager.included_reports == 0:
+                    row_buf[-1] = "No Data"
+                elif flagged[i]:
+                    row_buf[-1] = f"⚠ {flagged[i]} OOR"
+                else:
+                    row_buf[-1] = "✓ OK"
+
+                manager_rows.append(tuple(row_buf))
+
+        summary_rows.append(("Managers Outside Target Ranges", str(issues_count)))
+
+        # Section 3: Hierarchy Level Summary
+        hierarchy_rows = []
+        if not result.hierarchy_summaries:
+            hierarchy_rows.append(("No data",))
+        else:
+            # Already keyed in hierarchy level order
+            levels = list(result.hierarchy_summaries.keys())
+            summaries = list(result.hierarchy_summaries.values())
+            pcts = _stage_bucket_percentages(
+                [summary['bucket_percentages'] for summary in summaries], bucket_names
             )
+            codes, oor_counts = _classify_bucket_cells(pcts, result)
+
+            # One buffer reused for every row: level info, bucket cells, status
+            row_buf = [""] * (4 + nbuckets)
+            for i, (level, summary) in enumerate(zip(levels, summaries)):
+                row_buf[0] = f"Level {level}"
+                row_buf[1] = str(summary['manager_count'])
+                row_buf[2] = str(summary['total_included_reports'])
+
+                # Add bucket percentages
+                if summary['total_included_reports'] > 0:
+                    _fill_bucket_cells(row_buf, 3, pcts[i], codes[i], cell_cache)
+                    out_of_range_count = int(oor_counts[i])
+                else:
+                    row_buf[3:-1] = no_data_cells
+                    out_of_range_count = 0
 
-            # Count managers with issues
-            managers_with_issues = [
-                m for m in result.manager_details
-                if m.buckets_out_of_range and m.included_reports > 0
-            ]
-            summary_table.add_row(
-                "Managers Outside Target Ranges",
-                str(len(managers_with_issues))
+                # Add status
+                if summary['total_included_reports'] == 0:
+                    row_buf[-1] = "No Data"
+                elif out_of_range_count > 0:
+                    row_buf[-1] = f"⚠ {out_of_range_count} OOR"
+                else:
+                    row_buf[-1] = "✓ OK"
+
+                hierarchy_rows.append(tuple(row_buf))
+
+        return _ManagerReportRows(
+            bucket_columns=_bucket_columns(zip(
+                bucket_names,
+                result.bucket_min_pcts.tolist(),
+                result.bucket_max_pcts.tolist(),
+            )),
+            summary_rows=summary_rows,
+            manager_rows=manager_rows,
+            hierarchy_rows=hierarchy_rows,
+            issues_count=issues_count,
+        )
+
+    def on_worker_state_changed(self, event: Worker.StateChanged) -> None:
+        """Populate the tables once the report worker has finished."""
+        if event.worker.name != "_compute_data":
+            return
+        if event.state == WorkerState.SUCCESS:
+            self._populate_tables(event.worker.result)
+            if self._notify_refreshed:
+                self._notify_refreshed = False
+                self.app.notify("Data refreshed", severity="information")
+        elif event.state == WorkerState.ERROR:
+            self._notify_refreshed = False
+            for table in self._tables():
+                table.loading = False
+            self.app.notify(
+                f"Error loading manager distribution data: {str(event.worker.error)}",
+                severity="error"
             )
 
-            # Section 2: Individual Manager Distribution by Bucket
-            if not result.manager_details:
-                managers_table.add_row("No managers found")
-            else:
-                # Build column headers: Manager info + one column per bucket + status
-                columns = ["Manager", "Hier.\nLevel", "Total\nReports", "Incl.\nReports"]
-                for bucket in buckets:
-                    # Add column with bucket name and target range
-                    columns.append(f"{bucket.name}\n({bucket.min_percentage:.0f}-{bucket.max_percentage:.0f}%)")
-                columns.append("Status")
-
-                managers_table.add_columns(*columns)
-
-                # Sort managers by hierarchy level, then by name
-                sorted_managers = sorted(
-                    result.manager_details,
-                    key=lambda m: (m.hierarchy_level, m.manager_name)
-                )
-
-                for manager in sorted_managers:
-                    # Build row data
-                    row_data = [
-                        manager.manager_name,
-                        str(manager.hierarchy_level),
-                        str(manager.total_direct_reports),
-                        str(manager.included_reports),
-                    ]
-
-                    # Add bucket percentages
-                    for bucket in buckets:
-                        pct = manager.bucket_percentages.get(bucket.name, 0.0)
-
-                        # Format with indicator if out of range
-                        if manager.included_reports > 0:
-                            if pct < bucket.min_percentage:
-                                cell_text = f"↓ {pct:.1f}%"
-                            elif pct > bucket.max_percentage:
-                                cell_text = f"↑ {pct:.1f}%"
-                            else:
-                                cell_text = f"{pct:.1f}%"
-                        else:
-                            cell_text = "-"
-
-                        row_data.append(cell_text)
-
-                    # Add status column
-                    if manager.included_reports == 0:
-                        status = "No Data"
-                    elif manager.buckets_out_of_range:
-                        status = f"⚠ {len(manager.buckets_out_of_range)} OOR"
-                    else:
-                        status = "✓ OK"
-                    row_data.append(status)
-
-                    managers_table.add_row(*row_data)
-
-            # Section 3: Hierarchy Level Summary
-            if not result.hierarchy_summaries:
-                hierarchy_table.add_row("No data")
-            else:
-                # Build column headers similar to managers table
-                columns = ["Hierarchy\nLevel", "Managers", "Total\nIncluded"]
-                for bucket in buckets:
-                    columns.append(f"{bucket.name}\n({bucket.min_percentage:.0f}-{bucket.max_percentage:.0f}%)")
-                columns.append("Status")
-
-                hierarchy_table.add_columns(*columns)
-
-                # Sort by hierarchy level
-                for level in sorted(result.hierarchy_summaries.keys()):
-                    summary = result.hierarchy_summaries[level]
-
-                    row_data = [
-                        f"Level {level}",
-                        str(summary['manager_count']),
-                        str(summary['total_included_reports']),
-                    ]
-
-                    # Add bucket percentages
-                    out_of_range_count = 0
-                    for bucket in buckets:
-                        pct = summary['bucket_percentages'].get(bucket.name, 0.0)
-
-                        # Check if out of range
-                        if summary['total_included_reports'] > 0:
-                            if pct < bucket.min_percentage:
-                                cell_text = f"↓ {pct:.1f}%"
-                                out_of_range_count += 1
-                            elif pct > bucket.max_percentage:
-                                cell_text = f"↑ {pct:.1f}%"
-                                out_of_range_count += 1
-                            else:
-                                cell_text = f"{pct:.1f}%"
-                        else:
-                            cell_text = "-"
-
-                        row_data.append(cell_text)
-
-                    # Add status
-                    if summary['total_included_reports'] == 0:
-                        status = "No Data"
-                    elif out_of_range_count > 0:
-                        status = f"⚠ {out_of_range_count} OOR"
-                    else:
-                        status = "✓ OK"
-                    row_data.append(status)
-
-                    hierarchy_table.add_row(*row_data)
-
-            # Show notification if managers are out of range
-            if managers_with_issues:
-                self.app.notify(
-                    f"WARNING: {len(managers_with_issues)} manager(s) have distributions "
-                    "outside target ranges",
-                    severity="warning",
-                    timeout=10
-                )
-
-        except Exception as e:
-            self.app.notify(f"Error loading manager distribution data: {str(e)}", severity="error")
-        finally:
-            db.close()
+    def _populate_tables(self, rows: _ManagerReportRows) -> None:
+        """Add the pre-formatted rows to the tables (runs on the UI thread).
+
+        The summary is filled in straight away. The managers and hierarchy
+        tables sit below the fold on most terminals, so their rows are held
+        back until each table is scrolled into view.
+        """
+        summary_table, managers_table, hierarchy_table = self._tables()
+
+        with self.app.batch_update():
+            # Relabel the bucket columns if the buckets have changed since
+            # the headers were built
+            if rows.bucket_columns != self._bucket_columns:
+                self._bucket_columns = rows.bucket_columns
+                managers_table.clear(columns=True)
+                managers_table.add_columns(*self._build_manager_columns())
+                hierarchy_table.clear(columns=True)
+                hierarchy_table.add_columns(*self._build_hierarchy_columns())
+
+            summary_table.add_rows(rows.summary_rows)
+            # A loading indicator covers its table and hides the table's
+            # own region, so drop it before checking which tables are visible
+            for table in (summary_table, managers_table, hierarchy_table):
+                table.loading = False
+
+        self._pending_rows = {
+            managers_table: rows.manager_rows,
+            hierarchy_table: rows.hierarchy_rows,
+        }
+        self.call_after_refresh(self._load_visible_tables)
+
+        # Show notification if managers are out of range
+        if rows.issues_count:
+            self.app.notify(
+                f"WARNING: {rows.issues_count} manager(s) have distributions "
+                "outside target ranges",
+                severity="warning",
+                timeout=10
+            )
+
+    def _load_visible_tables(self) -> None:
+        """Add held-back rows to the first report table now scrolled into view.
+
+        Filling a table can push the tables below it down the screen, so only
+        one table is filled per pass. The next pass runs once the filled
+        table has been measured and laid out (see _schedule_visibility_check).
+        """
+        if not self._pending_rows:
+            return
+
+        # Compare positions within the scrolled content rather than on
+        # screen: the scroll offset is current as soon as it changes, while
+        # on-screen regions only catch up at the next compositor update
+        window = self._container.window_region
+        for table in self._pending_rows:
+            if table.virtual_region.overlaps(window):
+                # Insert the rows in one call so DataTable lays out and
+                # repaints once for the table rather than once per row
+                with self.app.batch_update():
+                    table.add_rows(self._pending_rows.pop(table))
+                return
+
+    def _schedule_visibility_check(self) -> None:
+        """Check for visible tables after the next layout and repaint."""
+        if self._pending_rows:
+            self.call_after_refresh(self._load_visible_tables)
+
+    def on_resize(self) -> None:
+        """Load any tables brought into view by a larger terminal."""
+        self._load_visible_tables()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
@@ -231,10 +520,13 @@ class ManagerDistributionScreen(Screen):
         elif event.button.id == "btn_back":
             self.action_back()
 
-    def action_refresh(self) -> None:
-        """Refresh the data tables."""
-        self.load_data()
-        self.app.notify("Data refreshed", severity="information")
+    def action_refresh(self, force: bool = True) -> None:
+        """Refresh the data tables.
+
+        Args:
+            force: If True, bypass the cached report and recalculate
+        """
+        self.load_data(force=force, notify_refreshed=True)
 
     def action_back(self) -> None:
         """Go back to the main menu."""
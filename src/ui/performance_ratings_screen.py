@@ -1,4 +1,6 @@
 """Performance Ratings CRUD screen."""
+from dataclasses import dataclass
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -15,10 +17,44 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from textual.message import Message
+from sqlalchemy import func, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError
 
 from ..database import get_db
-from ..models import PerformanceRating, DistributionBucket
+from ..models import Associate, PerformanceRating, DistributionBucket
+
+# Ratings fetched per batch when loading the ratings table
+_YIELD_PER = 100
+
+
+@dataclass
+class RatingRow:
+    """Field values of a rating as shown in the ratings table."""
+
+    id: int
+    description: str
+    level_indicator: int
+    excluded_from_distribution: bool
+    distribution_bucket_id: int | None
+
+
+def _rating_cells(row: RatingRow, bucket_name: str | None) -> tuple:
+    """Build the ratings table cells for a rating.
+
+    Args:
+        row: The rating's field values
+        bucket_name: Name of the rating's distribution bucket, if any
+
+    Returns:
+        Tuple of cell strings in column order
+    """
+    return (
+        str(row.id),
+        row.description,
+        str(row.level_indicator),
+        "Yes" if row.excluded_from_distribution else "No",
+        bucket_name or "(None)",
+    )
 
 
 class PerformanceRatingForm(Container):
@@ -46,11 +82,11 @@ class PerformanceRatingForm(Container):
         """Form cancelled message."""
         pass
 
-    def __init__(self, rating: PerformanceRating | None = None, **kwargs):
+    def __init__(self, rating: PerformanceRating | RatingRow | None = None, **kwargs):
         """Initialize the form.
 
         Args:
-            rating: Optional PerformanceRating to edit. If None, creates a new rating.
+            rating: Optional rating (or its loaded row values) to edit. If None, creates a new rating.
         """
         super().__init__(**kwargs)
         self.rating = rating
@@ -61,7 +97,7 @@ class PerformanceRatingForm(Container):
         title = "Edit Performance Rating" if self.is_edit_mode else "Add Performance Rating"
 
         with ScrollableContainer(classes="form-container"):
-            yield Static(title, classes="form-title")
+            yield Static(title, id="form_title", classes="form-title")
 
             yield Label("Description:")
             yield Input(
@@ -86,30 +122,60 @@ class PerformanceRatingForm(Container):
             )
 
             yield Label("Distribution Bucket:")
-            # Get buckets and create options
-            db = get_db()
-            try:
-                buckets = db.query(DistributionBucket).order_by(DistributionBucket.sort_order).all()
-                bucket_options = [("(None)", None)]
-                bucket_options.extend([(bucket.name, str(bucket.id)) for bucket in buckets])
-
-                current_bucket_value = None
-                if self.rating and self.rating.distribution_bucket_id:
-                    current_bucket_value = str(self.rating.distribution_bucket_id)
-
-                yield Select(
-                    bucket_options,
-                    value=current_bucket_value,
-                    allow_blank=True,
-                    id="select_bucket",
-                )
-            finally:
-                db.close()
+            current_bucket_value = None
+            if self.rating and self.rating.distribution_bucket_id:
+                current_bucket_value = str(self.rating.distribution_bucket_id)
+
+            yield Select(
+                self._bucket_options(),
+                value=current_bucket_value,
+                allow_blank=True,
+                id="select_bucket",
+            )
 
             with Horizontal(classes="form-buttons"):
                 yield Button("Save", variant="primary", id="btn_save")
                 yield Button("Cancel", variant="default", id="btn_cancel")
 
+    def _bucket_options(self) -> list:
+        """Load the distribution bucket options for the bucket select."""
+        db = get_db()
+        try:
+            buckets = db.query(DistributionBucket).order_by(DistributionBucket.sort_order).all()
+            bucket_options = [("(None)", None)]
+            bucket_options.extend([(bucket.name, str(bucket.id)) for bucket in buckets])
+            return bucket_options
+        finally:
+            db.close()
+
+    def load(self, rating: RatingRow | None = None) -> None:
+        """Reset the form's fields for adding a rating or editing an existing one.
+
+        Args:
+            rating: Loaded row values of the rating to edit. If None, the form adds a new rating.
+        """
+        self.rating = rating
+        self.is_edit_mode = rating is not None
+
+        self.query_one("#form_title", Static).update(
+            "Edit Performance Rating" if self.is_edit_mode else "Add Performance Rating"
+        )
+        self.query_one("#input_description", Input).value = rating.description if rating else ""
+        self.query_one("#input_level_indicator", Input).value = (
+            str(rating.level_indicator) if rating else ""
+        )
+        self.query_one("#checkbox_excluded", Checkbox).value = (
+            rating.excluded_from_distribution if rating else False
+        )
+
+        # Buckets may have changed since the form was last shown
+        bucket_select = self.query_one("#select_bucket", Select)
+        bucket_select.set_options(self._bucket_options())
+        bucket_select.value = (
+            str(rating.distribution_bucket_id)
+            if rating and rating.distribution_bucket_id else None
+        )
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "btn_save":
@@ -134,9 +200,9 @@ class PerformanceRatingForm(Container):
         if not description:
             errors.append("Description is required")
 
+        level = None
         if not level_str:
             errors.append("Level Indicator is required")
-            level = 0
         else:
             try:
                 level = int(level_str)
@@ -144,7 +210,6 @@ class PerformanceRatingForm(Container):
                     errors.append("Level Indicator must be greater than 0")
             except ValueError:
                 errors.append("Level Indicator must be a valid number")
-                level = 0
 
         if errors:
             self.app.notify("\n".join(errors), severity="error", timeout=5)
@@ -195,38 +260,66 @@ class PerformanceRatingsScreen(Screen):
 
             yield DataTable(id="ratings_table", zebra_stripes=True, cursor_type="row")
 
+            # Composed once and shown/hidden for add and edit
+            form = PerformanceRatingForm()
+            form.display = False
+            yield form
+
         yield Footer()
 
     def on_mount(self) -> None:
         """Set up the data table and load data."""
-        table = self.query_one("#ratings_table", DataTable)
-        table.add_columns("ID", "Description", "Level", "Excluded", "Bucket")
+        # Cache widget references so event handlers don't re-run selector queries
+        self._table = table = self.query_one("#ratings_table", DataTable)
+        self._column_keys = table.add_columns("ID", "Description", "Level", "Excluded", "Bucket")
         table.focus()
+        self._id_by_row = []  # Rating ID for each table row, by row index
+        self._row_key_by_id = {}  # Table row key for each rating ID
+        self._form = self.query_one(PerformanceRatingForm)
         self.load_data()
 
     def load_data(self) -> None:
         """Load performance ratings from the database."""
-        table = self.query_one("#ratings_table", DataTable)
-        table.clear()
+        table = self._table
 
         db = get_db()
         try:
-            ratings = db.query(PerformanceRating).order_by(PerformanceRating.level_indicator).all()
+            # Stream the ratings in batches instead of fetching them all at once
+            ratings = db.execute(
+                lambda_stmt(
+                    lambda: select(PerformanceRating).order_by(PerformanceRating.level_indicator)
+                ),
+                execution_options={"yield_per": _YIELD_PER},
+            ).scalars()
+
+            # Build every row first, then swap the table contents in one
+            # batched update so it is never shown half-filled
+            rows = []
+            id_by_row = []
+            rating_rows = {}
             for rating in ratings:
-                excluded_str = "Yes" if rating.excluded_from_distribution else "No"
-                bucket_str = rating.distribution_bucket.name if rating.distribution_bucket else "(None)"
-
-                table.add_row(
-                    str(rating.id),
-                    rating.description,
-                    str(rating.level_indicator),
-                    excluded_str,
-                    bucket_str,
-                    key=str(rating.id),
+                row = RatingRow(
+                    id=rating.id,
+                    description=rating.description,
+                    level_indicator=rating.level_indicator,
+                    excluded_from_distribution=rating.excluded_from_distribution,
+                    distribution_bucket_id=rating.distribution_bucket_id,
                 )
+                rating_rows[rating.id] = row
+                bucket_name = rating.distribution_bucket.name if rating.distribution_bucket else None
+                rows.append(_rating_cells(row, bucket_name))
+                id_by_row.append(rating.id)
         finally:
             db.close()
 
+        # Kept so edit/delete can use the loaded values without re-querying
+        self._rating_rows = rating_rows
+        self._id_by_row = id_by_row
+
+        with self.app.batch_update():
+            table.clear()
+            self._row_key_by_id = dict(zip(id_by_row, table.add_rows(rows)))
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "btn_add":
@@ -242,71 +335,104 @@ class PerformanceRatingsScreen(Screen):
 
     def action_add(self) -> None:
         """Show form to add a new rating."""
-        form_container = self.query_one(".screen-container", ScrollableContainer)
-
-        # Check if form already exists
-        existing_forms = form_container.query("PerformanceRatingForm")
-        if existing_forms:
+        # Ignore while the form is already open
+        if self._form.display:
             return
 
-        form = PerformanceRatingForm()
-        form_container.mount(form)
+        self._form.load()
+        self._form.display = True
 
     def action_edit(self) -> None:
         """Show form to edit selected rating."""
-        table = self.query_one("#ratings_table", DataTable)
+        table = self._table
 
         if table.cursor_row is None or not table.rows:
             self.app.notify("Please select a rating to edit", severity="warning")
             return
 
-        row_key = table.get_row_at(table.cursor_row)[0]
-        db = get_db()
-        try:
-            rating = db.query(PerformanceRating).filter_by(id=int(row_key)).first()
-            if not rating:
-                self.app.notify("Rating not found", severity="error")
-                return
+        rating = self._rating_rows.get(self._id_by_row[table.cursor_row])
+        if not rating:
+            self.app.notify("Rating not found", severity="error")
+            return
 
-            # Check if form already exists
-            form_container = self.query_one(".screen-container", ScrollableContainer)
-            existing_forms = form_container.query("PerformanceRatingForm")
-            if existing_forms:
-                return
+        # Ignore while the form is already open
+        if self._form.display:
+            return
 
-            form = PerformanceRatingForm(rating=rating)
-            form_container.mount(form)
-        finally:
-            db.close()
+        self._form.load(rating)
+        self._form.display = True
+
+    def _show_saved_rating(self, row: RatingRow, bucket_name: str | None) -> None:
+        """Show a saved rating in the table without reloading every row.
+
+        An edit that keeps the level indicator updates the rating's row in
+        place, and a new rating with the highest level indicator is appended.
+        Anything that changes the row order falls back to load_data().
+
+        Args:
+            row: The saved rating's field values
+            bucket_name: Name of the rating's distribution bucket, if any
+        """
+        table = self._table
+        cells = _rating_cells(row, bucket_name)
+        existing = self._rating_rows.get(row.id)
+
+        if existing is not None and existing.level_indicator == row.level_indicator:
+            row_key = self._row_key_by_id[row.id]
+            with self.app.batch_update():
+                for column_key, value in zip(self._column_keys, cells):
+                    table.update_cell(row_key, column_key, value, update_width=True)
+        elif existing is None and all(
+            other.level_indicator < row.level_indicator
+            for other in self._rating_rows.values()
+        ):
+            self._row_key_by_id[row.id] = table.add_row(*cells)
+            self._id_by_row.append(row.id)
+        else:
+            self.load_data()
+            return
+
+        self._rating_rows[row.id] = row
+
+    def _hide_form(self) -> None:
+        """Hide the form and return focus to the table."""
+        self._form.display = False
+        self._table.focus()
 
     def action_delete(self) -> None:
         """Delete the selected rating."""
-        table = self.query_one("#ratings_table", DataTable)
+        table = self._table
 
         if table.cursor_row is None or not table.rows:
             self.app.notify("Please select a rating to delete", severity="warning")
             return
 
-        row_key = table.get_row_at(table.cursor_row)[0]
+        rating_id = self._id_by_row[table.cursor_row]
         db = get_db()
         try:
-            rating = db.query(PerformanceRating).filter_by(id=int(row_key)).first()
-            if not rating:
-                self.app.notify("Rating not found", severity="error")
-                return
-
-            # Check if rating is in use by any associates
-            if rating.associates:
+            # Check if rating is in use by any associates (a COUNT rather
+            # than loading the rating's associates collection)
+            associate_count = db.execute(lambda_stmt(
+                lambda: select(func.count(Associate.id))
+                .where(Associate.performance_rating_id == rating_id)
+            )).scalar()
+            if associate_count:
                 self.app.notify(
-                    f"Cannot delete: {len(rating.associates)} associate(s) have this rating",
+                    f"Cannot delete: {associate_count} associate(s) have this rating",
                     severity="error",
                     timeout=5,
                 )
                 return
 
+            rating = db.get(PerformanceRating, rating_id)
+            if not rating:
+                self.app.notify("Rating not found", severity="error")
+                return
+
             description = rating.description
             db.delete(rating)
             db.commit()
+            self.app.invalidate_ratings()
             self.app.notify(f"Deleted: {description}", severity="information")
             self.load_data()
         except Exception as e:
@@ -330,7 +456,7 @@ class PerformanceRatingsScreen(Screen):
         try:
             if message.rating_id:
                 # Edit existing
-                rating = db.query(PerformanceRating).filter_by(id=message.rating_id).first()
+                rating = db.get(PerformanceRating, message.rating_id)
                 if rating:
                     rating.description = message.description
                     rating.level_indicator = message.level_indicator
@@ -352,14 +478,19 @@ class PerformanceRatingsScreen(Screen):
                 action = "Created"
 
             db.commit()
+            self.app.invalidate_ratings()
             self.app.notify(f"{action}: {rating.description}", severity="success")
-            self.load_data()
-
-            # Remove the form
-            form_container = self.query_one(".screen-container", ScrollableContainer)
-            forms = form_container.query("PerformanceRatingForm")
-            for form in forms:
-                form.remove()
+            self._show_saved_rating(
+                RatingRow(
+                    id=rating.id,
+                    description=rating.description,
+                    level_indicator=rating.level_indicator,
+                    excluded_from_distribution=rating.excluded_from_distribution,
+                    distribution_bucket_id=rating.distribution_bucket_id,
+                ),
+                rating.distribution_bucket.name if rating.distribution_bucket else None,
+            )
+            self._hide_form()
 
         except IntegrityError as e:
             db.rollback()
@@ -380,7 +511,4 @@ class PerformanceRatingsScreen(Screen):
 
     def on_performance_rating_form_cancelled(self, message: PerformanceRatingForm.Cancelled) -> None:
         """Handle form cancellation."""
-        form_container = self.query_one(".screen-container", ScrollableContainer)
-        forms = form_container.query("PerformanceRatingForm")
-        for form in forms:
-            form.remove()
+        self._hide_form()
@@ -1,4 +1,7 @@
 """Performance Rating Data Input screen for bulk assignment by level."""
+from collections import defaultdict
+from typing import List, Tuple
+
 from textual.app import ComposeResult
 from textual.screen import Screen
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -13,11 +16,19 @@ from textual.widgets import (
 )
 from textual.binding import Binding
 from textual.message import Message
+from sqlalchemy import case, func, lambda_stmt, select
 from sqlalchemy.exc import IntegrityError
 
 from ..database import get_db
 from ..models import Associate, AssociateLevel, PerformanceRating
 
+# Result rows fetched per batch when loading the associates table
+_YIELD_PER = 500
+
+# Above this many distinct new ratings, saving issues one UPDATE ... CASE
+# instead of one UPDATE per rating
+_CASE_UPDATE_THRESHOLD = 3
+
 
 class RatingInputScreen(Screen):
     """Screen for bulk assignment of performance ratings to associates by level."""
@@ -34,6 +45,7 @@ class RatingInputScreen(Screen):
         self.selected_level_id = None
         self.rating_changes = {}  # Track changes: {associate_id: rating_id}
         self.available_ratings = {}  # Cache: {rating_id: description}
+        self._reload_timer = None  # Debounces level filter changes
 
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
@@ -61,15 +73,27 @@ class RatingInputScreen(Screen):
 
             yield DataTable(id="associates_table", zebra_stripes=True, cursor_type="row")
 
+            # Composed once and shown/hidden per row selection
+            selector = RatingSelector(ratings=self.app.get_ratings())
+            selector.display = False
+            yield selector
+
         yield Footer()
 
     def on_mount(self) -> None:
         """Set up the data table and load data."""
         self._load_levels()
         self._load_ratings()
-        table = self.query_one("#associates_table", DataTable)
-        table.add_columns("ID", "Name", "Level", "Current Rating", "New Rating")
+        # Cache widget references so event handlers don't re-run selector queries
+        self._table = table = self.query_one("#associates_table", DataTable)
+        *_, self._new_rating_column = table.add_columns(
+            "ID", "Name", "Level", "Current Rating", "New Rating"
+        )
         table.focus()
+        self._id_by_row = []  # Associate ID for each table row, by row index
+        self._row_key_by_id = {}  # Table row key for each associate ID
+        self._selector = self.query_one(RatingSelector)
+        self._indicator = self.query_one("#changes_indicator", Static)
         self.load_data()
 
     def _load_levels(self) -> None:
@@ -77,7 +101,10 @@ class RatingInputScreen(Screen):
         level_select = self.query_one("#level_filter", Select)
         db = get_db()
         try:
-            levels = db.query(AssociateLevel).order_by(AssociateLevel.level_indicator).all()
+            levels = db.execute(lambda_stmt(
+                lambda: select(AssociateLevel.id, AssociateLevel.description)
+                .order_by(AssociateLevel.level_indicator)
+            )).all()
             options = [("All Levels", None)]
             options.extend([(level.description, str(level.id)) for level in levels])
             level_select.set_options(options)
@@ -86,77 +113,117 @@ class RatingInputScreen(Screen):
 
     def _load_ratings(self) -> None:
         """Load available performance ratings for quick lookup."""
-        db = get_db()
-        try:
-            ratings = db.query(PerformanceRating).order_by(PerformanceRating.level_indicator).all()
-            self.available_ratings = {rating.id: rating.description for rating in ratings}
-        finally:
-            db.close()
+        self.available_ratings = {
+            rating_id: description
+            for rating_id, description, _ in self.app.get_ratings()
+        }
 
     def load_data(self) -> None:
         """Load associates from the database based on selected level."""
-        table = self.query_one("#associates_table", DataTable)
-        table.clear()
+        table = self._table
 
         db = get_db()
         try:
-            query = db.query(Associate)
+            # Select just the displayed columns (name concatenated and a
+            # missing rating defaulted in SQL) so no ORM objects are built.
+            # lambda_stmt caches the compiled SQL; the level id is bound.
+            stmt = lambda_stmt(
+                lambda: select(
+                    Associate.id,
+                    (Associate.first_name + " " + Associate.last_name).label("full_name"),
+                    AssociateLevel.description.label("level_desc"),
+                    func.coalesce(PerformanceRating.description, "(Not Set)").label("cur_rating"),
+                ).select_from(Associate).join(
+                    AssociateLevel, Associate.associate_level_id == AssociateLevel.id
+                ).outerjoin(
+                    PerformanceRating, Associate.performance_rating_id == PerformanceRating.id
+                )
+            )
 
             # Filter by level if selected
-            if self.selected_level_id:
-                query = query.filter(Associate.associate_level_id == self.selected_level_id)
+            level_id = self.selected_level_id
+            if level_id:
+                stmt += lambda s: s.where(Associate.associate_level_id == level_id)
 
             # Order by level, then name
-            associates = query.join(AssociateLevel).order_by(
+            stmt += lambda s: s.order_by(
                 AssociateLevel.level_indicator,
                 Associate.last_name,
                 Associate.first_name
-            ).all()
-
-            for associate in associates:
-                current_rating = (
-                    associate.performance_rating.description
-                    if associate.performance_rating
-                    else "(Not Set)"
-                )
-
-                # Check if there's a pending change
-                new_rating = ""
-                if associate.id in self.rating_changes:
-                    new_rating_id = self.rating_changes[associate.id]
-                    if new_rating_id is None:
-                        new_rating = "(Clear Rating)"
-                    else:
-                        new_rating = self.available_ratings.get(new_rating_id, "")
+            )
 
-                table.add_row(
+            # Build every row first, then swap the table contents in one
+            # batched update so it is never shown half-filled. Result rows
+            # are streamed in batches rather than fetched all at once.
+            pending_label = self._pending_label
+            rows = []
+            id_by_row = []
+            for associate in db.execute(stmt, execution_options={"yield_per": _YIELD_PER}):
+                rows.append((
                     str(associate.id),
                     associate.full_name,
-                    associate.associate_level.description,
-                    current_rating,
-                    new_rating,
-                    key=str(associate.id),
-                )
+                    associate.level_desc,
+                    associate.cur_rating,
+                    pending_label(associate.id),
+                ))
+                id_by_row.append(associate.id)
         finally:
             db.close()
 
+        self._id_by_row = id_by_row
+        with self.app.batch_update():
+            table.clear()
+            self._row_key_by_id = dict(zip(id_by_row, table.add_rows(rows)))
+
+    def _pending_label(self, associate_id: int) -> str:
+        """Return the "New Rating" cell text for an associate.
+
+        Args:
+            associate_id: ID of the associate
+
+        Returns:
+            The pending rating's description, "(Clear Rating)" if the rating
+            is being cleared, or "" if there is no pending change
+        """
+        if associate_id not in self.rating_changes:
+            return ""
+        new_rating_id = self.rating_changes[associate_id]
+        if new_rating_id is None:
+            return "(Clear Rating)"
+        return self.available_ratings.get(new_rating_id, "")
+
     def on_select_changed(self, event: Select.Changed) -> None:
         """Handle level filter changes."""
         if event.select.id == "level_filter":
-            self.selected_level_id = int(event.value) if event.value else None
-            self.rating_changes.clear()  # Clear changes when switching levels
-            self._update_changes_indicator()
-            self.load_data()
+            # Only the last selection within the debounce window reloads the table
+            if self._reload_timer is not None:
+                self._reload_timer.stop()
+            value = event.value
+            self._reload_timer = self.set_timer(
+                0.15, lambda: self._apply_level_filter(value)
+            )
+
+    def _apply_level_filter(self, value) -> None:
+        """Apply a debounced level filter selection and reload the table.
+
+        Args:
+            value: The level filter's selected value
+        """
+        self._reload_timer = None
+        self.selected_level_id = int(value) if value else None
+        self.rating_changes.clear()  # Clear changes when switching levels
+        self._update_changes_indicator()
+        self.load_data()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection to edit rating."""
-        table = self.query_one("#associates_table", DataTable)
+        table = self._table
 
         if event.cursor_row is None:
             return
 
         row_data = table.get_row_at(event.cursor_row)
-        associate_id = int(row_data[0])
+        associate_id = self._id_by_row[event.cursor_row]
         associate_name = row_data[1]
         current_rating = row_data[3]
 
@@ -164,45 +231,39 @@ class RatingInputScreen(Screen):
         self._show_rating_selector(associate_id, associate_name, current_rating)
 
     def _show_rating_selector(self, associate_id: int, associate_name: str, current_rating: str) -> None:
-        """Show a modal to select a new rating for the associate."""
-        # Create a modal-like container
-        container = self.query_one(".screen-container", Container)
-
-        # Check if selector already exists
-        existing = container.query("RatingSelector")
-        if existing:
+        """Show the rating selector for the associate."""
+        # Ignore row selections while the selector is already open
+        if self._selector.display:
             return
 
-        selector = RatingSelector(
-            associate_id=associate_id,
-            associate_name=associate_name,
-            current_rating=current_rating,
-            available_ratings=self.available_ratings,
-        )
-        container.mount(selector)
+        self._selector.show(associate_id, associate_name, current_rating)
+
+    def _hide_rating_selector(self) -> None:
+        """Hide the rating selector and return focus to the table."""
+        self._selector.display = False
+        self._table.focus()
 
     def on_rating_selector_rating_selected(self, message) -> None:
         """Handle rating selection from the modal."""
         self.rating_changes[message.associate_id] = message.rating_id
         self._update_changes_indicator()
-        self.load_data()
 
-        # Remove the selector
-        container = self.query_one(".screen-container", Container)
-        selectors = container.query("RatingSelector")
-        for selector in selectors:
-            selector.remove()
+        # Only the selected associate's "New Rating" cell changes
+        self._table.update_cell(
+            self._row_key_by_id[message.associate_id],
+            self._new_rating_column,
+            self._pending_label(message.associate_id),
+            update_width=True,
+        )
+        self._hide_rating_selector()
 
     def on_rating_selector_cancelled(self, message) -> None:
         """Handle rating selector cancellation."""
-        container = self.query_one(".screen-container", Container)
-        selectors = container.query("RatingSelector")
-        for selector in selectors:
-            selector.remove()
+        self._hide_rating_selector()
 
     def _update_changes_indicator(self) -> None:
         """Update the changes indicator to show pending changes."""
-        indicator = self.query_one("#changes_indicator", Static)
+        indicator = self._indicator
         count = len(self.rating_changes)
         if count > 0:
             indicator.update(f"Pending changes: {count}")
@@ -226,12 +287,34 @@ class RatingInputScreen(Screen):
 
         db = get_db()
         try:
-            saved_count = 0
+            # One UPDATE per distinct new rating rather than a SELECT and
+            # UPDATE per associate
+            changes_by_rating = defaultdict(list)  # rating_id -> [associate_id]
             for associate_id, rating_id in self.rating_changes.items():
-                associate = db.query(Associate).filter_by(id=associate_id).first()
-                if associate:
-                    associate.performance_rating_id = rating_id
-                    saved_count += 1
+                changes_by_rating[rating_id].append(associate_id)
+
+            if len(changes_by_rating) > _CASE_UPDATE_THRESHOLD:
+                # Many distinct ratings: a single UPDATE picking each
+                # associate's new rating with a CASE on the id
+                saved_count = db.query(Associate).filter(
+                    Associate.id.in_(list(self.rating_changes))
+                ).update(
+                    {
+                        Associate.performance_rating_id: case(
+                            self.rating_changes, value=Associate.id
+                        )
+                    },
+                    synchronize_session=False
+                )
+            else:
+                saved_count = 0
+                for rating_id, associate_ids in changes_by_rating.items():
+                    saved_count += db.query(Associate).filter(
+                        Associate.id.in_(associate_ids)
+                    ).update(
+                        {Associate.performance_rating_id: rating_id},
+                        synchronize_session=False
+                    )
 
             db.commit()
             self.app.notify(
@@ -289,53 +372,69 @@ class RatingSelector(Container):
 
     def __init__(
         self,
-        associate_id: int,
-        associate_name: str,
-        current_rating: str,
-        available_ratings: dict,
+        associate_id: int | None = None,
+        associate_name: str = "",
+        current_rating: str = "",
+        ratings: List[Tuple[int, str, int]] | None = None,
         **kwargs
     ):
         """Initialize the rating selector.
 
         Args:
-            associate_id: ID of the associate
+            associate_id: ID of the associate (set later by show() when reused)
             associate_name: Full name of the associate
             current_rating: Current rating description
-            available_ratings: Dict of rating_id -> description
+            ratings: (id, description, level_indicator) tuples ordered by level indicator
         """
         super().__init__(**kwargs)
         self.associate_id = associate_id
         self.associate_name = associate_name
         self.current_rating = current_rating
-        self.available_ratings = available_ratings
+        self.ratings = ratings or []
 
     def compose(self) -> ComposeResult:
         """Compose the selector layout."""
         with ScrollableContainer(classes="modal-container"):
-            yield Static(f"Select Rating for {self.associate_name}", classes="modal-title")
-            yield Static(f"Current: {self.current_rating}", classes="modal-subtitle")
+            yield Static(
+                f"Select Rating for {self.associate_name}",
+                id="selector_title",
+                classes="modal-title",
+            )
+            yield Static(
+                f"Current: {self.current_rating}",
+                id="selector_current",
+                classes="modal-subtitle",
+            )
 
             with Vertical(classes="rating-buttons"):
                 # Add button to clear rating
                 yield Button("(Clear Rating)", id="rating_none", variant="default")
 
-                # Add button for each available rating
-                db = get_db()
-                try:
-                    ratings = db.query(PerformanceRating).order_by(
-                        PerformanceRating.level_indicator.desc()
-                    ).all()
-                    for rating in ratings:
-                        yield Button(
-                            f"{rating.description} (Level {rating.level_indicator})",
-                            id=f"rating_{rating.id}",
-                            variant="primary"
-                        )
-                finally:
-                    db.close()
+                # Add button for each available rating, best first
+                for rating_id, description, level_indicator in reversed(self.ratings):
+                    yield Button(
+                        f"{description} (Level {level_indicator})",
+                        id=f"rating_{rating_id}",
+                        variant="primary"
+                    )
 
                 yield Button("Cancel", id="btn_cancel", variant="error")
 
+    def show(self, associate_id: int, associate_name: str, current_rating: str) -> None:
+        """Point the selector at an associate and display it.
+
+        Args:
+            associate_id: ID of the associate
+            associate_name: Full name of the associate
+            current_rating: Current rating description
+        """
+        self.associate_id = associate_id
+        self.associate_name = associate_name
+        self.current_rating = current_rating
+        self.query_one("#selector_title", Static).update(f"Select Rating for {associate_name}")
+        self.query_one("#selector_current", Static).update(f"Current: {current_rating}")
+        self.display = True
+
     def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         if event.button.id == "btn_cancel":
@@ -1,12 +1,82 @@
 """CSV import utility for bulk loading associates."""
 import csv
-from typing import List, Dict, Tuple, Optional
+import os
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Iterable, List, Dict, Set, Tuple, Optional
 from dataclasses import dataclass
+import pandas as pd
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import Column, Integer, MetaData, Table, func, insert, or_, select, update
 
 from ..models import Associate, AssociateLevel
 
+# Columns read from the import file, in the order of the sample CSV
+_CSV_COLUMNS = (
+    'first_name',
+    'last_name',
+    'level',
+    'manager_first_name',
+    'manager_last_name',
+    'is_people_manager',
+)
+
+# Column names checked by validate_csv_file
+_REQUIRED_COLUMNS = frozenset({'first_name', 'last_name', 'level'})
+_OPTIONAL_COLUMNS = frozenset({'manager_first_name', 'manager_last_name', 'is_people_manager'})
+_ALL_COLUMNS = _REQUIRED_COLUMNS | _OPTIONAL_COLUMNS
+
+# Files larger than this (in bytes) are parsed in parallel worker processes.
+# Spawning the workers costs about a second, which smaller files parse in.
+_PARALLEL_PARSE_BYTES = 16_000_000
+
+# Rows per chunk handed to a worker process
+_PARSE_CHUNK_ROWS = 50_000
+
+# Read buffer for the import file (the default is 8 KB)
+_READ_BUFFER_BYTES = 1 << 20
+
+# Temporary per-import table of resolved (associate, manager) pairs
+_MANAGER_STAGE = Table(
+    "_csv_manager_stage",
+    MetaData(),
+    Column("associate_id", Integer, primary_key=True),
+    Column("manager_id", Integer, nullable=False),
+    prefixes=["TEMPORARY"],
+)
+
+# Imports naming at most this many distinct people look up just those
+# associates (through ix_associates_name_lower); larger files read the
+# whole name list in one scan
+_TARGETED_LOOKUP_MAX_NAMES = 5_000
+
+# Names per targeted lookup query (two bound parameters each, kept under
+# SQLite's default limit of 999)
+_LOOKUP_CHUNK_NAMES = 400
+
+# Per-row parse error messages by code. Rows record (code, row_number,
+# *details) and the messages are formatted once the block has been
+# validated: {0} is the row number, {1} the first detail.
+_PARSE_ERRORS = {
+    'first_name_required': "Row {0}: first_name is required",
+    'last_name_required': "Row {0}: last_name is required",
+    'level_required': "Row {0}: level is required",
+    'manager_incomplete': (
+        "Row {0}: Both manager_first_name and manager_last_name must be "
+        "provided together, or both left empty"
+    ),
+    'row_error': "Row {0}: Error parsing row - {1}",
+}
+
+# Skipped duplicates listed individually in the warnings; the rest are
+# summarized in one line
+_MAX_SKIPPED_WARNINGS = 10
+
+# is_people_manager values (lowercased) that mean True
+_TRUTHY = frozenset({'true', 'yes', '1', 'y'})
+
 
 @dataclass
 class ImportResult:
@@ -19,15 +89,19 @@ class ImportResult:
     warnings: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class AssociateRow:
-    """Represents a single row from the CSV."""
+    """Represents a single row from the CSV (slotted: one per imported row)."""
     row_number: int
     first_name: str
     last_name: str
     level: str
     manager_first_name: Optional[str]
     manager_last_name: Optional[str]
+    # Lowercased lookup keys, computed once at parse time
+    level_key: str
+    associate_key: Tuple[str, str]
+    manager_key: Optional[Tuple[str, str]]
     is_people_manager: bool = False  # Default to False if not provided
 
 
@@ -45,32 +119,31 @@ def validate_csv_file(file_path: str) -> Tuple[bool, List[str]]:
 
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+            # Positional reader: only the header and one data row are needed,
+            # so no per-row dicts are built
+            reader = csv.reader(f)
+            header = next(reader, None)
 
-            # Check required columns
-            required_columns = {'first_name', 'last_name', 'level'}
-            optional_columns = {'manager_first_name', 'manager_last_name', 'is_people_manager'}
-            all_columns = required_columns | optional_columns
-
-            if not reader.fieldnames:
+            if not header:
                 errors.append("CSV file is empty or has no header row")
                 return False, errors
 
             # Normalize column names (strip whitespace, lowercase)
-            normalized_fields = {col.strip().lower() for col in reader.fieldnames}
+            normalized_fields = {col.strip().lower() for col in header}
 
-            missing_columns = required_columns - normalized_fields
+            # Check required columns
+            missing_columns = _REQUIRED_COLUMNS - normalized_fields
             if missing_columns:
                 errors.append(f"Missing required columns: {', '.join(missing_columns)}")
 
             # Check for unexpected columns (warn but don't fail)
-            extra_columns = normalized_fields - all_columns
+            extra_columns = normalized_fields - _ALL_COLUMNS
             if extra_columns:
                 errors.append(f"Warning: Unexpected columns will be ignored: {', '.join(extra_columns)}")
 
-            # Check if file has data
-            rows = list(reader)
-            if not rows:
+            # Check if file has data (only the first row is read; the file
+            # is parsed in full by parse_csv_file); blank lines are skipped
+            if next((row for row in reader if row), None) is None:
                 errors.append("CSV file has no data rows")
 
     except FileNotFoundError:
@@ -83,10 +156,152 @@ def validate_csv_file(file_path: str) -> Tuple[bool, List[str]]:
     return len(errors) == 0, errors
 
 
+def _parse_frame(df: pd.DataFrame, first_row_number: int) -> Tuple[List[AssociateRow], List[str]]:
+    """
+    Clean and validate a block of CSV rows.
+
+    Module-level so it can run in a worker process for large files.
+
+    Args:
+        df: Rows as read by pandas (all values strings)
+        first_row_number: CSV row number of the block's first row (the header is row 1)
+
+    Returns:
+        Tuple of (list of AssociateRow objects, list of parse errors)
+    """
+    rows = []
+    raw_errors = []  # (error code, row number, *details)
+
+    # Normalize field names; optional columns missing from the file, and
+    # cells missing from short rows, are empty
+    df.columns = df.columns.str.strip().str.lower()
+    df = df.reindex(columns=list(_CSV_COLUMNS), fill_value="").fillna("")
+
+    # Extract and clean values
+    for col in _CSV_COLUMNS:
+        df[col] = df[col].str.strip()
+
+    # Parse is_people_manager (optional, defaults to False)
+    is_people_manager = df['is_people_manager'].str.lower().isin(_TRUTHY)
+
+    # Lowercase the lookup columns once per column rather than per row.
+    # Level names repeat on most rows, so they are interned.
+    lowered = {col: df[col].str.lower() for col in _CSV_COLUMNS[:5]}
+    lowered['level'] = lowered['level'].map(sys.intern)
+
+    for (
+        i, first_name, last_name, level, manager_first, manager_last, is_manager,
+        first_lc, last_lc, level_lc, manager_first_lc, manager_last_lc,
+    ) in zip(
+        range(first_row_number, first_row_number + len(df)),
+        df['first_name'],
+        df['last_name'],
+        df['level'],
+        df['manager_first_name'],
+        df['manager_last_name'],
+        is_people_manager,
+        lowered['first_name'],
+        lowered['last_name'],
+        lowered['level'],
+        lowered['manager_first_name'],
+        lowered['manager_last_name'],
+    ):
+        try:
+            manager_first = manager_first or None
+            manager_last = manager_last or None
+
+            # Validate required fields
+            if not first_name:
+                raw_errors.append(('first_name_required', i))
+                continue
+            if not last_name:
+                raw_errors.append(('last_name_required', i))
+                continue
+            if not level:
+                raw_errors.append(('level_required', i))
+                continue
+
+            # Validate manager fields (both or neither)
+            if (manager_first and not manager_last) or (manager_last and not manager_first):
+                raw_errors.append(('manager_incomplete', i))
+                continue
+
+            rows.append(AssociateRow(
+                row_number=i,
+                first_name=first_name,
+                last_name=last_name,
+                level=level,
+                manager_first_name=manager_first,
+                manager_last_name=manager_last,
+                level_key=level_lc,
+                associate_key=(first_lc, last_lc),
+                manager_key=(manager_first_lc, manager_last_lc) if manager_first else None,
+                is_people_manager=bool(is_manager)
+            ))
+
+        except Exception as e:
+            raw_errors.append(('row_error', i, str(e)))
+
+    errors = [_PARSE_ERRORS[code].format(*args) for code, *args in raw_errors]
+    return rows, errors
+
+
+def _read_and_parse(
+    file_path: str,
+    parallel: bool,
+    **read_options
+) -> Tuple[List[AssociateRow], List[str]]:
+    """
+    Read a CSV file with pandas and validate its rows.
+
+    Args:
+        file_path: Path to CSV file
+        parallel: Validate the file in chunks in worker processes
+        **read_options: Keyword arguments for pd.read_csv
+
+    Returns:
+        Tuple of (list of AssociateRow objects, list of parse errors)
+    """
+    rows = []
+    errors = []
+
+    # Fields past the header are dropped, as DictReader ignored them;
+    # pandas warns about that on every such file
+    with warnings.catch_warnings(), open(file_path, 'rb', buffering=_READ_BUFFER_BYTES) as f:
+        warnings.simplefilter("ignore", pd.errors.ParserWarning)
+
+        if not parallel:
+            # Small files (or a single CPU): not worth the worker start-up cost
+            return _parse_frame(pd.read_csv(f, **read_options), 2)
+
+        # Workers are spawned rather than forked since the app is threaded
+        with pd.read_csv(
+            f, chunksize=_PARSE_CHUNK_ROWS, **read_options
+        ) as chunks, ProcessPoolExecutor(mp_context=get_context("spawn")) as pool:
+            futures = []
+            first_row_number = 2  # Start at 2 (1 for header)
+            for chunk in chunks:
+                futures.append(pool.submit(_parse_frame, chunk, first_row_number))
+                first_row_number += len(chunk)
+
+            # Merge in file order
+            for future in futures:
+                chunk_rows, chunk_errors = future.result()
+                rows.extend(chunk_rows)
+                errors.extend(chunk_errors)
+
+    return rows, errors
+
+
 def parse_csv_file(file_path: str) -> Tuple[List[AssociateRow], List[str]]:
     """
     Parse CSV file into AssociateRow objects.
 
+    The file is read with pandas and values are cleaned a column at a time;
+    only the per-row validation loops in Python. Files over
+    _PARALLEL_PARSE_BYTES are read in chunks that are validated in
+    parallel worker processes.
+
     Args:
         file_path: Path to CSV file
 
@@ -97,57 +312,37 @@ def parse_csv_file(file_path: str) -> Tuple[List[AssociateRow], List[str]]:
     errors = []
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-
-            # Normalize field names
-            if reader.fieldnames:
-                reader.fieldnames = [col.strip().lower() for col in reader.fieldnames]
-
-            for i, row_dict in enumerate(reader, start=2):  # Start at 2 (1 for header)
-                try:
-                    # Extract and clean values
-                    first_name = row_dict.get('first_name', '').strip()
-                    last_name = row_dict.get('last_name', '').strip()
-                    level = row_dict.get('level', '').strip()
-                    manager_first = row_dict.get('manager_first_name', '').strip() or None
-                    manager_last = row_dict.get('manager_last_name', '').strip() or None
-
-                    # Parse is_people_manager (optional, defaults to False)
-                    is_people_manager_str = row_dict.get('is_people_manager', '').strip().lower()
-                    is_people_manager = is_people_manager_str in ('true', 'yes', '1', 'y')
-
-                    # Validate required fields
-                    if not first_name:
-                        errors.append(f"Row {i}: first_name is required")
-                        continue
-                    if not last_name:
-                        errors.append(f"Row {i}: last_name is required")
-                        continue
-                    if not level:
-                        errors.append(f"Row {i}: level is required")
-                        continue
-
-                    # Validate manager fields (both or neither)
-                    if (manager_first and not manager_last) or (manager_last and not manager_first):
-                        errors.append(
-                            f"Row {i}: Both manager_first_name and manager_last_name must be "
-                            "provided together, or both left empty"
-                        )
-                        continue
-
-                    rows.append(AssociateRow(
-                        row_number=i,
-                        first_name=first_name,
-                        last_name=last_name,
-                        level=level,
-                        manager_first_name=manager_first,
-                        manager_last_name=manager_last,
-                        is_people_manager=is_people_manager
-                    ))
-
-                except Exception as e:
-                    errors.append(f"Row {i}: Error parsing row - {str(e)}")
+        # Read only the known columns (matched after normalizing the header),
+        # every value as a string with empty cells kept as "". index_col=False
+        # stops pandas from turning the first column into the index when
+        # rows have more fields than the header (e.g. trailing commas).
+        read_options = dict(
+            dtype=str,
+            keep_default_na=False,
+            na_filter=False,
+            encoding='utf-8',
+            index_col=False,
+            usecols=lambda col: col.strip().lower() in _ALL_COLUMNS,
+        )
+
+        parallel = (
+            (os.cpu_count() or 1) >= 2
+            and os.path.getsize(file_path) > _PARALLEL_PARSE_BYTES
+        )
+
+        try:
+            rows, errors = _read_and_parse(file_path, parallel, **read_options)
+        except pd.errors.ParserError:
+            # The C tokenizer rejects rows with more fields than the first
+            # data row. The Python engine accepts them, dropping the extra
+            # fields; it is slower, so it is only used for such files.
+            rows, errors = _read_and_parse(
+                file_path,
+                False,
+                engine='python',
+                on_bad_lines=lambda fields: fields,
+                **read_options
+            )
 
     except Exception as e:
         errors.append(f"Error reading CSV file: {str(e)}")
@@ -155,6 +350,116 @@ def parse_csv_file(file_path: str) -> Tuple[List[AssociateRow], List[str]]:
     return rows, errors
 
 
+def _load_associate_ids(
+    db: Session,
+    wanted: Set[Tuple[str, str]]
+) -> Dict[Tuple[str, str], int]:
+    """
+    Look up the IDs of existing associates by lowercased (first, last) name.
+
+    Small imports query only the names they mention, matched through the
+    lower(first_name), lower(last_name) expression index. SQLite's lower()
+    only folds ASCII, so files with other names fall back to reading every
+    associate and lowercasing in Python.
+
+    Args:
+        db: Database session
+        wanted: Lowercased (first_name, last_name) keys referenced by the file
+
+    Returns:
+        Dictionary mapping lowercased (first_name, last_name) to associate ID.
+        May include associates that were not asked for.
+    """
+    columns = select(Associate.id, Associate.first_name, Associate.last_name)
+
+    if len(wanted) > _TARGETED_LOOKUP_MAX_NAMES or not all(
+        first.isascii() and last.isascii() for first, last in wanted
+    ):
+        results: Iterable = db.execute(columns)
+    else:
+        # Each query matches the chunk's first names and last names
+        # separately (both are index seeks); mismatched pairs it returns
+        # are never looked up
+        keys = list(wanted)
+        results = []
+        for start in range(0, len(keys), _LOOKUP_CHUNK_NAMES):
+            chunk = keys[start:start + _LOOKUP_CHUNK_NAMES]
+            results.extend(db.execute(columns.where(
+                func.lower(Associate.first_name).in_({first for first, _ in chunk}),
+                func.lower(Associate.last_name).in_({last for _, last in chunk}),
+            )))
+
+    return {
+        (first_name.lower(), last_name.lower()): associate_id
+        for associate_id, first_name, last_name in results
+    }
+
+
+def _apply_manager_assignments(
+    db: Session,
+    manager_ids: Dict[int, int],
+    people_manager_ids: Set[int]
+) -> None:
+    """
+    Set manager_id for imported associates and flag their managers.
+
+    The (associate, manager) pairs are bulk-inserted into a temporary
+    staging table, then applied with one UPDATE ... FROM join and one
+    UPDATE for is_people_manager, so no statement carries a bind parameter
+    per associate.
+
+    Args:
+        db: Database session (the staging table lives on its connection)
+        manager_ids: Mapping of associate_id -> manager_id
+        people_manager_ids: Every manager named by an imported row, including
+            rows whose assignment a later row for the same associate replaced
+    """
+    # A failed import can leave the table behind on a pooled connection
+    # (SQLite may run the DDL outside the transaction), so start clean
+    connection = db.connection()
+    _MANAGER_STAGE.drop(connection, checkfirst=True)
+    _MANAGER_STAGE.create(connection)
+
+    db.execute(
+        insert(_MANAGER_STAGE),
+        [
+            {"associate_id": associate_id, "manager_id": manager_id}
+            for associate_id, manager_id in manager_ids.items()
+        ]
+    )
+
+    # Rows that already hold the value are not rewritten, so re-importing
+    # an unchanged file writes nothing here
+    db.execute(
+        update(Associate)
+        .where(
+            Associate.id == _MANAGER_STAGE.c.associate_id,
+            Associate.manager_id.is_distinct_from(_MANAGER_STAGE.c.manager_id),
+        )
+        .values(manager_id=_MANAGER_STAGE.c.manager_id)
+        .execution_options(synchronize_session=False)
+    )
+
+    # Mark managers as people managers. Managers whose only assignment was
+    # replaced by a later row aren't in the staging table; they are rare,
+    # so they are listed directly.
+    is_named_manager = Associate.id.in_(select(_MANAGER_STAGE.c.manager_id))
+    replaced_manager_ids = people_manager_ids.difference(manager_ids.values())
+    if replaced_manager_ids:
+        is_named_manager = or_(is_named_manager, Associate.id.in_(replaced_manager_ids))
+    db.execute(
+        update(Associate)
+        .where(
+            is_named_manager,
+            Associate.is_people_manager.is_(False),
+        )
+        .values(is_people_manager=True)
+        .execution_options(synchronize_session=False)
+    )
+
+    _MANAGER_STAGE.drop(connection)
+
+
 def import_associates_from_csv(
     db: Session,
     file_path: str,
@@ -202,102 +507,136 @@ def import_associates_from_csv(
             return result
 
     # Get all levels (cache for lookups)
-    levels = db.execute(select(AssociateLevel)).scalars().all()
-    level_map = {level.description.lower(): level for level in levels}
-
-    # Get all existing associates (cache for lookups)
-    existing_associates = db.execute(select(Associate)).scalars().all()
-    associate_map = {
-        (assoc.first_name.lower(), assoc.last_name.lower()): assoc
-        for assoc in existing_associates
-    }
+    levels = db.execute(
+        select(AssociateLevel.id, AssociateLevel.description).order_by(AssociateLevel.id)
+    ).all()
+    level_ids = {sys.intern(description.lower()): level_id for level_id, description in levels}
+    # Built once; appended to every "level not found" error
+    available_levels = f"Available levels: {', '.join(level_ids.keys())}"
+
+    # IDs of the existing associates the file names (as associates or
+    # managers), by lowercased name; no ORM objects are loaded. New
+    # associates are added after the insert so the second pass can resolve
+    # every row.
+    wanted = {row.associate_key for row in rows}
+    wanted.update(row.manager_key for row in rows if row.manager_key)
+    associate_ids = _load_associate_ids(db, wanted)
 
     # Process all rows in a single transaction
     try:
-        # Process each row - First pass: Create/update associates
-        processed_associates = []
+        # First pass: collect new associates and level updates. Nothing in
+        # the session is modified, so no flush happens before the commit;
+        # the inserts/updates are issued together after the pass (manager
+        # will be assigned in the second pass).
+        new_rows_by_key = {}  # (first, last) lowercased -> insert parameters
+        level_updates = {}  # existing associate_id -> associate_level_id
 
         for row in rows:
             try:
                 # Find level
-                level = level_map.get(row.level.lower())
-                if not level:
+                level_id = level_ids.get(row.level_key)
+                if level_id is None:
                     result.errors.append(
                         f"Row {row.row_number}: Level '{row.level}' not found. "
-                        f"Available levels: {', '.join(level_map.keys())}"
+                        + available_levels
                     )
                     continue
 
-                # Check if associate already exists
-                associate_key = (row.first_name.lower(), row.last_name.lower())
-                existing_associate = associate_map.get(associate_key)
+                # Check if associate already exists (in the database or
+                # earlier in this file)
+                associate_key = row.associate_key
+                existing_id = associate_ids.get(associate_key)
+                pending_row = new_rows_by_key.get(associate_key)
 
-                if existing_associate:
+                if existing_id is not None or pending_row:
                     if update_existing:
                         # Update existing associate
-                        existing_associate.associate_level_id = level.id
+                        if existing_id is not None:
+                            level_updates[existing_id] = level_id
+                        else:
+                            pending_row["associate_level_id"] = level_id
                         result.updated_count += 1
-                        processed_associates.append(existing_associate)
                     else:
                         result.skipped_count += 1
-                        result.warnings.append(
-                            f"Row {row.row_number}: Associate '{row.first_name} {row.last_name}' "
-                            "already exists (skipped)"
-                        )
+                        if result.skipped_count <= _MAX_SKIPPED_WARNINGS:
+                            result.warnings.append(
+                                f"Row {row.row_number}: Associate '{row.first_name} {row.last_name}' "
+                                "already exists (skipped)"
+                            )
                     continue
 
-                # Create new associate (manager will be assigned in second pass)
-                new_associate = Associate(
-                    first_name=row.first_name,
-                    last_name=row.last_name,
-                    associate_level_id=level.id,
-                    is_people_manager=row.is_people_manager  # From CSV, will be set to True if they have direct reports
-                )
-
-                db.add(new_associate)
-                processed_associates.append(new_associate)
+                new_rows_by_key[associate_key] = {
+                    "first_name": row.first_name,
+                    "last_name": row.last_name,
+                    "associate_level_id": level_id,
+                    # From CSV, will be set to True if they have direct reports
+                    "is_people_manager": row.is_people_manager,
+                }
                 result.created_count += 1
 
-                # Update cache
-                associate_map[associate_key] = new_associate
-
             except Exception as e:
                 result.errors.append(f"Row {row.row_number}: Error processing - {str(e)}")
 
-        # Flush to get IDs for new associates
-        db.flush()
-
-        # Second pass: Assign managers
+        if result.skipped_count > _MAX_SKIPPED_WARNINGS:
+            result.warnings.append(
+                f"... and {result.skipped_count - _MAX_SKIPPED_WARNINGS} more existing "
+                "associate(s) skipped"
+            )
+
+        # Apply level updates to existing associates as one executemany
+        # UPDATE by primary key
+        if level_updates:
+            db.execute(
+                update(Associate),
+                [
+                    {"id": associate_id, "associate_level_id": level_id}
+                    for associate_id, level_id in level_updates.items()
+                ]
+            )
+
+        # Insert all new associates in one statement, returning their IDs
+        # in parameter order
+        if new_rows_by_key:
+            new_ids = db.execute(
+                insert(Associate).returning(Associate.id, sort_by_parameter_order=True),
+                list(new_rows_by_key.values())
+            ).scalars().all()
+            associate_ids.update(zip(new_rows_by_key, new_ids))
+
+        # Second pass: Resolve managers
+        manager_ids = {}  # associate_id -> manager_id (a later row wins)
+        people_manager_ids = set()  # Every manager named by a row
         for row in rows:
             try:
                 # Find the associate we just created/updated
-                associate_key = (row.first_name.lower(), row.last_name.lower())
-                associate = associate_map.get(associate_key)
+                associate_id = associate_ids.get(row.associate_key)
 
-                if not associate:
+                if associate_id is None:
                     continue  # Already reported error in first pass
 
                 # Assign manager if specified
-                if row.manager_first_name and row.manager_last_name:
-                    manager_key = (row.manager_first_name.lower(), row.manager_last_name.lower())
-                    manager = associate_map.get(manager_key)
+                if row.manager_key:
+                    manager_id = associate_ids.get(row.manager_key)
 
-                    if not manager:
+                    if manager_id is None:
                         result.warnings.append(
                             f"Row {row.row_number}: Manager '{row.manager_first_name} "
                             f"{row.manager_last_name}' not found for '{row.first_name} {row.last_name}'. "
                             "Ensure manager is defined earlier in the CSV or already exists in database."
                         )
                     else:
-                        associate.manager_id = manager.id
-                        # Mark manager as people manager
-                        manager.is_people_manager = True
+                        manager_ids[associate_id] = manager_id
+                        people_manager_ids.add(manager_id)
 
             except Exception as e:
                 result.errors.append(
                     f"Row {row.row_number}: Error assigning manager - {str(e)}"
                 )
 
+        # Apply the manager assignments set-wise through a staging table
+        if manager_ids:
+            _apply_manager_assignments(db, manager_ids, people_manager_ids)
+
         # Commit entire transaction
         db.commit()
         result.success = True
@@ -316,43 +655,15 @@ def generate_sample_csv(file_path: str) -> None:
     Args:
         file_path: Path where sample CSV should be created
     """
+    # Rows in _CSV_COLUMNS order
     sample_data = [
-        {
-            'first_name': 'John',
-            'last_name': 'CEO',
-            'level': 'Executive',
-            'manager_first_name': '',
-            'manager_last_name': '',
-            'is_people_manager': 'true'
-        },
-        {
-            'first_name': 'Jane',
-            'last_name': 'Director',
-            'level': 'Director',
-            'manager_first_name': 'John',
-            'manager_last_name': 'CEO',
-            'is_people_manager': 'true'
-        },
-        {
-            'first_name': 'Bob',
-            'last_name': 'Manager',
-            'level': 'Manager',
-            'manager_first_name': 'Jane',
-            'manager_last_name': 'Director',
-            'is_people_manager': 'true'
-        },
-        {
-            'first_name': 'Alice',
-            'last_name': 'Employee',
-            'level': 'Individual Contributor',
-            'manager_first_name': 'Bob',
-            'manager_last_name': 'Manager',
-            'is_people_manager': 'false'
-        },
+        ('John', 'CEO', 'Executive', '', '', 'true'),
+        ('Jane', 'Director', 'Director', 'John', 'CEO', 'true'),
+        ('Bob', 'Manager', 'Manager', 'Jane', 'Director', 'true'),
+        ('Alice', 'Employee', 'Individual Contributor', 'Bob', 'Manager', 'false'),
     ]
 
     with open(file_path, 'w', newline='', encoding='utf-8') as f:
-        fieldnames = ['first_name', 'last_name', 'level', 'manager_first_name', 'manager_last_name', 'is_people_manager']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(_CSV_COLUMNS)
         writer.writerows(sample_data)
@@ -1,5 +1,6 @@
 """Data management utilities for bulk operations."""
 from typing import Tuple
+from sqlalchemy import delete
 from sqlalchemy.orm import Session
 
 from ..models import Associate
@@ -19,15 +20,22 @@ def clear_all_associates(db: Session) -> Tuple[bool, int, str]:
         Tuple of (success, count_deleted, message)
     """
     try:
-        # Get count before deletion
-        count = db.query(Associate).count()
+        # Delete all associates in one Core statement; the statement's row
+        # count replaces a separate COUNT query, and no in-session objects
+        # are loaded just to be expired
+        # Note: A Core delete runs no ORM cascades (direct_reports'
+        # cascade, passive_deletes), so integrity rests on the database
+        # foreign keys. The only one referencing associates is their own
+        # manager_id (ON DELETE SET NULL), and every row is removed here
+        result = db.execute(
+            delete(Associate).execution_options(synchronize_session=False)
+        )
+        count = result.rowcount
 
         if count == 0:
+            db.rollback()
             return True, 0, "No associates to delete"
 
-        # Delete all associates
-        # Note: This will cascade due to the relationship definitions
-        db.query(Associate).delete()
         db.commit()
 
         return True, count, f"Successfully deleted {count} associate(s)"
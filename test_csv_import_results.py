@@ -0,0 +1,256 @@
+"""
+Test script comparing CSV import results with the original row-by-row importer.
+The same files are imported through the serial parse, the parallel parse and
+the full-scan name lookup. Counts, messages and the resulting associates must
+match what the original importer produced for them.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+
+import src.database.config as db_config
+from src.database import get_db, init_db
+from src.models import Associate, AssociateLevel
+from src.utils import csv_importer
+from src.utils.csv_importer import import_associates_from_csv
+
+# Managers referenced before they are defined, mixed case and accented
+# names, an associate listed twice with different managers, an unknown
+# level and an unknown manager
+FIRST_CSV = (
+    "first_name,last_name,level,manager_first_name,manager_last_name,is_people_manager\n"
+    "John,CEO,Executive,,,true\n"
+    "Jane,Director,Director,John,CEO,\n"
+    " José , Núñez ,Manager,jane,DIRECTOR,no\n"
+    "Bob,Smith,Individual Contributor,José,Núñez,\n"
+    "Amy,Early,Individual Contributor,Late,Manager,\n"
+    "Late,Manager,Manager,John,CEO,yes\n"
+    "Bob,Smith,Individual Contributor,Jane,Director,\n"
+    "Zed,Unknown,Wizard,John,CEO,\n"
+    "Orphan,Kid,Individual Contributor,No,Body,\n"
+    "Cy,Cle,Manager,Jane,Director,1\n"
+)
+
+# Moves existing associates to new managers and levels, and adds one
+CHANGES_CSV = (
+    "first_name,last_name,level,manager_first_name,manager_last_name,is_people_manager\n"
+    "John,CEO,Executive,,,true\n"
+    "jane,director,Manager,Late,Manager,\n"
+    "Bob,Smith,Individual Contributor,Cy,Cle,\n"
+    "New,Hire,Individual Contributor,Bob,Smith,\n"
+)
+
+LEVEL_ERROR = (
+    "Row 9: Level 'Wizard' not found. Available levels: "
+    "individual contributor, manager, director, executive"
+)
+ORPHAN_WARNING = (
+    "Row 10: Manager 'No Body' not found for 'Orphan Kid'. "
+    "Ensure manager is defined earlier in the CSV or already exists in database."
+)
+
+# (first_name, last_name, level, manager, is_people_manager) after each import
+FIRST_ASSOCIATES = [
+    ("Amy", "Early", "Individual Contributor", "Late Manager", False),
+    ("Bob", "Smith", "Individual Contributor", "Jane Director", False),
+    ("Cy", "Cle", "Manager", "Jane Director", True),
+    ("Jane", "Director", "Director", "John CEO", True),
+    ("John", "CEO", "Executive", None, True),
+    ("José", "Núñez", "Manager", "Jane Director", True),
+    ("Late", "Manager", "Manager", "John CEO", True),
+    ("Orphan", "Kid", "Individual Contributor", None, False),
+]
+CHANGES_SKIPPED_ASSOCIATES = [
+    ("Amy", "Early", "Individual Contributor", "Late Manager", False),
+    ("Bob", "Smith", "Individual Contributor", "Cy Cle", True),
+    ("Cy", "Cle", "Manager", "Jane Director", True),
+    ("Jane", "Director", "Director", "Late Manager", True),
+    ("John", "CEO", "Executive", None, True),
+    ("José", "Núñez", "Manager", "Jane Director", True),
+    ("Late", "Manager", "Manager", "John CEO", True),
+    ("New", "Hire", "Individual Contributor", "Bob Smith", False),
+    ("Orphan", "Kid", "Individual Contributor", None, False),
+]
+CHANGES_UPDATED_ASSOCIATES = [
+    ("Jane", "Director", "Manager", "Late Manager", True)
+    if associate[0] == "Jane" else associate
+    for associate in CHANGES_SKIPPED_ASSOCIATES
+]
+
+# (file, update_existing, created, updated, skipped, errors, warnings, associates)
+SCENARIOS = [
+    (
+        FIRST_CSV, False, 8, 0, 1, [LEVEL_ERROR],
+        ["Row 8: Associate 'Bob Smith' already exists (skipped)", ORPHAN_WARNING],
+        FIRST_ASSOCIATES,
+    ),
+    (
+        FIRST_CSV, False, 0, 0, 9, [LEVEL_ERROR],
+        [
+            "Row 2: Associate 'John CEO' already exists (skipped)",
+            "Row 3: Associate 'Jane Director' already exists (skipped)",
+            "Row 4: Associate 'José Núñez' already exists (skipped)",
+            "Row 5: Associate 'Bob Smith' already exists (skipped)",
+            "Row 6: Associate 'Amy Early' already exists (skipped)",
+            "Row 7: Associate 'Late Manager' already exists (skipped)",
+            "Row 8: Associate 'Bob Smith' already exists (skipped)",
+            "Row 10: Associate 'Orphan Kid' already exists (skipped)",
+            "Row 11: Associate 'Cy Cle' already exists (skipped)",
+            ORPHAN_WARNING,
+        ],
+        FIRST_ASSOCIATES,
+    ),
+    (
+        FIRST_CSV, True, 0, 9, 0, [LEVEL_ERROR], [ORPHAN_WARNING],
+        FIRST_ASSOCIATES,
+    ),
+    (
+        CHANGES_CSV, False, 1, 0, 3, [],
+        [
+            "Row 2: Associate 'John CEO' already exists (skipped)",
+            "Row 3: Associate 'jane director' already exists (skipped)",
+            "Row 4: Associate 'Bob Smith' already exists (skipped)",
+        ],
+        CHANGES_SKIPPED_ASSOCIATES,
+    ),
+    (
+        CHANGES_CSV, True, 0, 4, 0, [], [],
+        CHANGES_UPDATED_ASSOCIATES,
+    ),
+]
+
+
+@contextmanager
+def _temp_database():
+    """Point the application's engine and sessions at an empty database.
+
+    The original engine is restored afterwards, so other tests in the same
+    run still use the application database.
+    """
+    original_engine = db_config.engine
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp_dir, 'test.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        db_config.engine = engine
+        db_config.SessionLocal.configure(bind=engine)
+        try:
+            init_db()
+            yield tmp_dir
+        finally:
+            engine.dispose()
+            db_config.engine = original_engine
+            db_config.SessionLocal.configure(bind=original_engine)
+
+
+def _create_levels():
+    """Create the associate levels the import files refer to."""
+    db = get_db()
+    try:
+        db.add_all([
+            AssociateLevel(description=description, level_indicator=indicator)
+            for indicator, description in enumerate(
+                ["Individual Contributor", "Manager", "Director", "Executive"], 1
+            )
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def _associates():
+    """Return every associate as a sortable tuple."""
+    db = get_db()
+    try:
+        return sorted(
+            (
+                associate.first_name,
+                associate.last_name,
+                associate.associate_level.description,
+                associate.manager.full_name if associate.manager else None,
+                associate.is_people_manager,
+            )
+            for associate in db.query(Associate).all()
+        )
+    finally:
+        db.close()
+
+
+def _run_scenarios(label):
+    """Import every scenario file into a fresh database and check the results."""
+    print("\n" + "="*60)
+    print(label)
+    print("="*60)
+
+    with _temp_database() as tmp_dir:
+        _create_levels()
+        path = os.path.join(tmp_dir, "associates.csv")
+
+        for (text, update_existing, created, updated, skipped,
+             errors, warnings, associates) in SCENARIOS:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(text)
+
+            db = get_db()
+            try:
+                result = import_associates_from_csv(db, path, update_existing=update_existing)
+            finally:
+                db.close()
+
+            print(
+                f"  update_existing={update_existing}: created {result.created_count}, "
+                f"updated {result.updated_count}, skipped {result.skipped_count}"
+            )
+            assert result.success
+            assert (result.created_count, result.updated_count, result.skipped_count) == (
+                created, updated, skipped
+            )
+            assert result.errors == errors
+            assert result.warnings == warnings
+            assert _associates() == associates
+            print("    ✓ Counts, messages and associates match")
+
+
+def test_import_results():
+    """Serial parse with targeted name lookups (the default for small files)."""
+    _run_scenarios("Serial parse, targeted lookups")
+
+
+def test_parallel_parse_import_results():
+    """Files parsed in chunks by worker processes import the same way."""
+    settings = (
+        csv_importer._PARALLEL_PARSE_BYTES,
+        csv_importer._PARSE_CHUNK_ROWS,
+        csv_importer.os.cpu_count,
+    )
+    csv_importer._PARALLEL_PARSE_BYTES = 0
+    csv_importer._PARSE_CHUNK_ROWS = 3
+    csv_importer.os.cpu_count = lambda: 2
+    try:
+        _run_scenarios("Parallel parse")
+    finally:
+        (
+            csv_importer._PARALLEL_PARSE_BYTES,
+            csv_importer._PARSE_CHUNK_ROWS,
+            csv_importer.os.cpu_count,
+        ) = settings
+
+
+def test_full_scan_import_results():
+    """Files naming too many people for targeted lookups import the same way."""
+    limit = csv_importer._TARGETED_LOOKUP_MAX_NAMES
+    csv_importer._TARGETED_LOOKUP_MAX_NAMES = 0
+    try:
+        _run_scenarios("Full-scan name lookup")
+    finally:
+        csv_importer._TARGETED_LOOKUP_MAX_NAMES = limit
+
+
+if __name__ == "__main__":
+    test_import_results()
+    test_parallel_parse_import_results()
+    test_full_scan_import_results()
+    print("\n✓ All CSV import result tests passed!")
@@ -0,0 +1,181 @@
+"""
+Test script for CSV import file parsing.
+Covers ragged rows (trailing commas, extra and missing fields), per-row
+errors, and the parallel parse path for large files.
+"""
+import os
+import tempfile
+
+import pandas as pd
+
+from src.utils import csv_importer
+from src.utils.csv_importer import parse_csv_file
+
+
+def _parse_text(text):
+    """Write CSV text to a temporary file and parse it."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "associates.csv")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+        return parse_csv_file(path)
+
+
+def _names(rows):
+    """Return (first_name, last_name, level) for each parsed row."""
+    return [(row.first_name, row.last_name, row.level) for row in rows]
+
+
+def test_trailing_commas():
+    """Rows ending in a comma (Excel exports) keep their columns."""
+    print("Parsing rows with trailing commas...")
+    rows, errors = _parse_text(
+        "first_name,last_name,level\n"
+        "John,CEO,Executive,\n"
+        "Jane,Director,Director,\n"
+    )
+    assert errors == []
+    assert _names(rows) == [
+        ("John", "CEO", "Executive"),
+        ("Jane", "Director", "Director"),
+    ]
+    print("  ✓ Columns kept")
+
+
+def test_extra_fields():
+    """Extra fields are dropped rather than shifting columns."""
+    print("Parsing rows with extra fields...")
+
+    # Extra field on the first data row
+    rows, errors = _parse_text(
+        "first_name,last_name,level\n"
+        "John,CEO,Executive,extra\n"
+        "Jane,Director,Director\n"
+    )
+    assert errors == []
+    assert _names(rows) == [
+        ("John", "CEO", "Executive"),
+        ("Jane", "Director", "Director"),
+    ]
+    print("  ✓ Extra field on the first row ignored")
+
+    # A later row wider than the first
+    rows, errors = _parse_text(
+        "first_name,last_name,level,manager_first_name,manager_last_name\n"
+        "John,CEO,Executive,,\n"
+        "Jane,Director,Director,John,CEO,extra,more\n"
+    )
+    assert errors == []
+    assert _names(rows) == [
+        ("John", "CEO", "Executive"),
+        ("Jane", "Director", "Director"),
+    ]
+    assert rows[1].manager_key == ("john", "ceo")
+    print("  ✓ Extra fields on a later row ignored")
+
+
+def test_short_rows():
+    """Missing trailing cells are empty: optional ones are fine, required ones error."""
+    print("Parsing rows with missing trailing fields...")
+    rows, errors = _parse_text(
+        "first_name,last_name,level,manager_first_name,manager_last_name\n"
+        "Jane,Director,Director,John,CEO,extra\n"
+        "Jon,Short,Manager\n"
+        "Only,Names\n"
+    )
+    assert _names(rows) == [
+        ("Jane", "Director", "Director"),
+        ("Jon", "Short", "Manager"),
+    ]
+    assert rows[1].manager_first_name is None
+    assert errors == ["Row 4: level is required"]
+    print(f"  ✓ {len(rows)} rows parsed, errors: {errors}")
+
+
+def test_row_errors():
+    """Invalid rows are reported by row number; valid rows still import."""
+    print("Parsing rows with validation errors...")
+    rows, errors = _parse_text(
+        "first_name,last_name,level,manager_first_name,manager_last_name,is_people_manager\n"
+        " Ann , Top ,Executive,,,Y\n"
+        ",Nobody,Manager,,,\n"
+        "Bea,Mid,Manager,Ann,,\n"
+        "Cal,Low,Individual Contributor,Bea,Mid,no\n"
+    )
+    assert _names(rows) == [
+        ("Ann", "Top", "Executive"),
+        ("Cal", "Low", "Individual Contributor"),
+    ]
+    assert [row.row_number for row in rows] == [2, 5]
+    assert [row.is_people_manager for row in rows] == [True, False]
+    assert rows[0].associate_key == ("ann", "top")
+    assert errors == [
+        "Row 3: first_name is required",
+        "Row 4: Both manager_first_name and manager_last_name must be "
+        "provided together, or both left empty",
+    ]
+    print(f"  ✓ {len(rows)} rows parsed, {len(errors)} errors reported")
+
+    # An exception while building one row becomes that row's error
+    real_row = csv_importer.AssociateRow
+
+    def fail_on_bad(**fields):
+        if fields["first_name"] == "Bad":
+            raise ValueError("boom")
+        return real_row(**fields)
+
+    csv_importer.AssociateRow = fail_on_bad
+    try:
+        df = pd.DataFrame({
+            "first_name": ["Ann", "Bad", "Cal"],
+            "last_name": ["Top", "Row", "Low"],
+            "level": ["Executive", "Manager", "Manager"],
+        })
+        rows, errors = csv_importer._parse_frame(df, 2)
+    finally:
+        csv_importer.AssociateRow = real_row
+    assert _names(rows) == [("Ann", "Top", "Executive"), ("Cal", "Low", "Manager")]
+    assert errors == ["Row 3: Error parsing row - boom"]
+    print("  ✓ Row exception isolated to its row")
+
+
+def test_parallel_parse():
+    """The chunked worker-process path returns the same rows and errors."""
+    print("Parsing in parallel worker processes...")
+    lines = ["first_name,last_name,level"]
+    lines += [f"First{i},Last{i},Manager," for i in range(20)]
+    lines.append(",Missing,Manager")
+    text = "\n".join(lines) + "\n"
+
+    serial = _parse_text(text)
+
+    settings = (
+        csv_importer._PARALLEL_PARSE_BYTES,
+        csv_importer._PARSE_CHUNK_ROWS,
+        csv_importer.os.cpu_count,
+    )
+    csv_importer._PARALLEL_PARSE_BYTES = 0
+    csv_importer._PARSE_CHUNK_ROWS = 6
+    csv_importer.os.cpu_count = lambda: 2
+    try:
+        parallel = _parse_text(text)
+    finally:
+        (
+            csv_importer._PARALLEL_PARSE_BYTES,
+            csv_importer._PARSE_CHUNK_ROWS,
+            csv_importer.os.cpu_count,
+        ) = settings
+
+    assert parallel == serial
+    assert len(serial[0]) == 20
+    assert serial[1] == ["Row 22: first_name is required"]
+    print("  ✓ Parallel parse matches serial parse")
+
+
+if __name__ == "__main__":
+    test_trailing_commas()
+    test_extra_fields()
+    test_short_rows()
+    test_row_errors()
+    test_parallel_parse()
+    print("\n✓ All CSV parsing tests passed!")
@@ -0,0 +1,119 @@
+"""
+Test script for data_version(), the counter report screens use to decide
+whether a cached report is still fresh.
+Every committed write must advance it, whether made through ORM objects or
+insert/update/delete statements; reads and rolled-back writes must not.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine, insert, select, update
+
+import src.database.config as db_config
+from src.database import data_version, get_db, init_db
+from src.models import Associate, AssociateLevel
+from src.reports.distribution_calculator import calculate_manager_distributions
+from src.utils.data_management import clear_all_associates
+
+
+@contextmanager
+def _temp_database():
+    """Point the application's engine and sessions at an empty database.
+
+    The original engine is restored afterwards, so other tests in the same
+    run still use the application database.
+    """
+    original_engine = db_config.engine
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp_dir, 'test.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        db_config.engine = engine
+        db_config.SessionLocal.configure(bind=engine)
+        try:
+            init_db()
+            yield tmp_dir
+        finally:
+            engine.dispose()
+            db_config.engine = original_engine
+            db_config.SessionLocal.configure(bind=original_engine)
+
+
+def _check(description, advanced, action):
+    """Run an action and check whether it advanced the data version."""
+    before = data_version()
+    action()
+    after = data_version()
+    assert (after > before) == advanced, description
+    print(f"  ✓ {description}: {before} -> {after}")
+
+
+def test_data_version():
+    """Committed writes advance the data version; reads and rollbacks don't."""
+    with _temp_database():
+        db = get_db()
+        try:
+            print("Checking data version changes...")
+            level = AssociateLevel(description="Manager", level_indicator=1)
+
+            def add_level():
+                db.add(level)
+                db.commit()
+            _check("ORM insert committed", True, add_level)
+
+            def read_only():
+                db.execute(select(AssociateLevel)).all()
+                db.commit()
+            _check("Read-only transaction committed", False, read_only)
+
+            def rolled_back_flush():
+                level.description = "Changed"
+                db.flush()
+                db.rollback()
+            _check("ORM change flushed then rolled back", False, rolled_back_flush)
+
+            def bulk_insert():
+                db.execute(insert(Associate), [
+                    {"first_name": f"First{i}", "last_name": "Last",
+                     "associate_level_id": level.id, "is_people_manager": i == 0}
+                    for i in range(3)
+                ])
+                db.commit()
+            _check("Bulk insert statement committed", True, bulk_insert)
+
+            def rolled_back_update():
+                db.execute(update(Associate).values(last_name="Other"))
+                db.rollback()
+            _check("Update statement rolled back", False, rolled_back_update)
+
+            def report_change():
+                # A report cached before the change must not be reused
+                version = data_version()
+                cached = calculate_manager_distributions(db)
+                db.rollback()
+                db.execute(
+                    update(Associate)
+                    .where(Associate.first_name != "First0")
+                    .values(manager_id=select(Associate.id)
+                            .where(Associate.first_name == "First0")
+                            .scalar_subquery())
+                )
+                db.commit()
+                assert data_version() != version
+                fresh = calculate_manager_distributions(db)
+                db.rollback()
+                assert cached.total_associates_under_managers == 0
+                assert fresh.total_associates_under_managers == 2
+            _check("Manager assignment update committed", True, report_change)
+
+            _check("Associates cleared", True, lambda: clear_all_associates(db))
+            _check("Clearing an empty table", False, lambda: clear_all_associates(db))
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    test_data_version()
+    print("\n✓ All data version tests passed!")
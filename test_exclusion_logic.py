@@ -124,7 +124,7 @@ def test_exclusion_logic():
         print("="*70)
 
         summary = get_level_distribution_summary(db)
-        for level_desc, data in sorted(summary.items(), key=lambda x: x[1]['level_indicator']):
+        for level_desc, data in summary.items():
             print(f"\n{level_desc} (Level {data['level_indicator']}):")
             print(f"  Max %: {data['max_percentage']}")
             print(f"  Excluded from distribution: {data['exclude_from_distribution']}")
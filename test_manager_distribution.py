@@ -0,0 +1,293 @@
+"""
+Test script comparing the manager distribution report with a direct
+per-manager calculation.
+The report aggregates direct reports in the database and holds bucket
+percentages in one manager x bucket array. Here each manager's direct reports
+are walked through the ORM relationships, as the report originally did, and
+every figure must match.
+"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+from sqlalchemy import create_engine
+
+import src.database.config as db_config
+from src.database import get_db, init_db
+from src.models import Associate, AssociateLevel, PerformanceRating, DistributionBucket
+from src.reports.distribution_calculator import (
+    calculate_hierarchy_level,
+    calculate_manager_distributions,
+)
+
+
+@contextmanager
+def _temp_database():
+    """Point the application's engine and sessions at an empty database.
+
+    The original engine is restored afterwards, so other tests in the same
+    run still use the application database.
+    """
+    original_engine = db_config.engine
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{os.path.join(tmp_dir, 'test.db')}",
+            connect_args={"check_same_thread": False},
+        )
+        db_config.engine = engine
+        db_config.SessionLocal.configure(bind=engine)
+        try:
+            init_db()
+            yield tmp_dir
+        finally:
+            engine.dispose()
+            db_config.engine = original_engine
+            db_config.SessionLocal.configure(bind=original_engine)
+
+
+def _create_org(db):
+    """Create an org chart covering the report's edge cases."""
+    level_ic = AssociateLevel(description="Individual Contributor", level_indicator=1)
+    level_manager = AssociateLevel(description="Manager", level_indicator=2)
+    level_executive = AssociateLevel(description="Executive", level_indicator=3)
+    db.add_all([level_ic, level_manager, level_executive])
+
+    # Created out of sort order, so bucket columns must follow sort_order
+    bucket_low = DistributionBucket(name="Low", min_percentage=0, max_percentage=15, sort_order=3)
+    bucket_core = DistributionBucket(name="Core", min_percentage=50, max_percentage=75, sort_order=2)
+    bucket_top = DistributionBucket(name="Top", min_percentage=10, max_percentage=25, sort_order=1)
+    db.add_all([bucket_low, bucket_core, bucket_top])
+    db.commit()
+
+    rating_top = PerformanceRating(description="Exceeds", level_indicator=3,
+                                   distribution_bucket_id=bucket_top.id)
+    rating_core = PerformanceRating(description="Meets", level_indicator=2,
+                                    distribution_bucket_id=bucket_core.id)
+    rating_low = PerformanceRating(description="Below", level_indicator=1,
+                                   distribution_bucket_id=bucket_low.id)
+    rating_no_bucket = PerformanceRating(description="Unbucketed", level_indicator=4)
+    rating_excluded = PerformanceRating(description="Too New", level_indicator=5,
+                                        excluded_from_distribution=True)
+    db.add_all([rating_top, rating_core, rating_low, rating_no_bucket, rating_excluded])
+    db.commit()
+
+    ratings = [rating_top, rating_core, rating_core, rating_low,
+               rating_no_bucket, rating_excluded, None]
+
+    def add(first, last, level, manager=None, is_manager=False, rating=None):
+        associate = Associate(
+            first_name=first, last_name=last, associate_level_id=level.id,
+            manager_id=manager.id if manager else None,
+            is_people_manager=is_manager,
+            performance_rating_id=rating.id if rating else None,
+        )
+        db.add(associate)
+        db.flush()
+        return associate
+
+    ceo = add("Ada", "Chief", level_executive, is_manager=True)
+
+    # Leads share a last name so ordering falls back to first names
+    leads = [
+        add(f"Lead{i}", "Same", level_manager, ceo, True, ratings[i])
+        for i in range(4)
+    ]
+    n = 0
+    for i, lead in enumerate(leads):
+        for k in range(3 + i * 2):
+            add(f"IC{n}", "Worker", level_ic, lead, False,
+                ratings[(n * 5 + k) % len(ratings)])
+            n += 1
+
+    sub = add("Sub", "Manager", level_manager, leads[0], True, rating_core)
+    for k in range(4):
+        add(f"Deep{k}", "Worker", level_ic, sub, False,
+            rating_top if k == 0 else rating_core)
+
+    # A manager with no reports, and one with only excluded/unrated reports
+    add("Empty", "Manager", level_manager, leads[1], True, rating_core)
+    only_excluded = add("Only", "Excluded", level_manager, leads[2], True)
+    add("X1", "Worker", level_ic, only_excluded, False, rating_excluded)
+    add("X2", "Worker", level_ic, only_excluded, False)
+
+    # Two managers reporting to each other
+    loop_a = add("Loop", "A", level_manager, None, True, rating_core)
+    loop_b = add("Loop", "B", level_manager, loop_a, True, rating_core)
+    loop_a.manager_id = loop_b.id
+    add("LoopKid", "Worker", level_ic, loop_a, False, rating_top)
+    db.commit()
+
+
+def _walk_hierarchy_level(associate):
+    """Count managers above an associate through the manager relationship."""
+    level = 0
+    seen_ids = set()
+    current = associate
+    while current.manager_id is not None:
+        if current.manager_id in seen_ids:
+            break
+        seen_ids.add(current.id)
+        current = current.manager
+        level += 1
+    return level
+
+
+def _expected_managers(db):
+    """Calculate each manager's figures from their direct reports, one by one."""
+    buckets = db.query(DistributionBucket).order_by(DistributionBucket.sort_order).all()
+    bucket_map = {bucket.id: bucket for bucket in buckets}
+
+    expected = {}
+    for manager in db.query(Associate).filter(Associate.is_people_manager.is_(True)):
+        unrated = excluded = 0
+        included = []
+        for report in manager.direct_reports:
+            if report.performance_rating_id is None:
+                unrated += 1
+            elif report.performance_rating.excluded_from_distribution:
+                excluded += 1
+            else:
+                included.append(report)
+
+        rating_counts = {}
+        bucket_counts = {}
+        for report in included:
+            rating = report.performance_rating
+            rating_counts[rating.description] = rating_counts.get(rating.description, 0) + 1
+            bucket = bucket_map.get(rating.distribution_bucket_id)
+            if bucket:
+                bucket_counts[bucket.name] = bucket_counts.get(bucket.name, 0) + 1
+
+        rating_percentages = {}
+        bucket_percentages = {}
+        out_of_range = []
+        if included:
+            for rating, count in rating_counts.items():
+                rating_percentages[rating] = (count / len(included)) * 100
+            for bucket in buckets:
+                count = bucket_counts.get(bucket.name, 0)
+                percentage = (count / len(included)) * 100
+                bucket_percentages[bucket.name] = percentage
+                if percentage < bucket.min_percentage or percentage > bucket.max_percentage:
+                    if count > 0:
+                        out_of_range.append(bucket.name)
+
+        expected[manager.id] = {
+            "manager_name": manager.full_name,
+            "manager_level": manager.associate_level.description,
+            "hierarchy_level": _walk_hierarchy_level(manager),
+            "total_direct_reports": len(manager.direct_reports),
+            "rated_reports": len(included),
+            "unrated_reports": unrated,
+            "excluded_reports": excluded,
+            "included_reports": len(included),
+            "rating_counts": rating_counts,
+            "rating_percentages": rating_percentages,
+            "bucket_counts": bucket_counts,
+            "bucket_percentages": bucket_percentages,
+            "buckets_out_of_range": out_of_range,
+        }
+    return expected
+
+
+def _expected_hierarchy(expected):
+    """Aggregate the expected manager figures by hierarchy level."""
+    summaries = {}
+    for figures in expected.values():
+        summary = summaries.setdefault(figures["hierarchy_level"], {
+            "manager_count": 0,
+            "total_included_reports": 0,
+            "rating_counts": {},
+            "bucket_counts": {},
+        })
+        summary["manager_count"] += 1
+        summary["total_included_reports"] += figures["included_reports"]
+        for key in ("rating_counts", "bucket_counts"):
+            for name, count in figures[key].items():
+                summary[key][name] = summary[key].get(name, 0) + count
+
+    for summary in summaries.values():
+        total = summary["total_included_reports"]
+        for key in ("rating", "bucket"):
+            summary[f"{key}_percentages"] = {
+                name: (count / total) * 100
+                for name, count in summary[f"{key}_counts"].items()
+            } if total else {}
+    return summaries
+
+
+def test_manager_distribution():
+    """The manager distribution report matches a per-manager calculation."""
+    with _temp_database():
+        db = get_db()
+        try:
+            print("Creating org chart...")
+            _create_org(db)
+
+            report = calculate_manager_distributions(db)
+            expected = _expected_managers(db)
+
+            print("\n" + "="*60)
+            print("MANAGER DETAILS")
+            print("="*60)
+            assert report.total_managers == len(expected)
+            assert report.total_associates_under_managers == sum(
+                figures["total_direct_reports"] for figures in expected.values()
+            )
+            for detail in report.manager_details:
+                figures = expected[detail.manager_id]
+                for field, value in figures.items():
+                    assert getattr(detail, field) == value, (detail.manager_name, field)
+                print(
+                    f"  {detail.manager_name:15s} level {detail.hierarchy_level}: "
+                    f"{detail.included_reports} included, "
+                    f"out of range: {detail.buckets_out_of_range or '-'}"
+                )
+            print(f"✓ {len(expected)} managers match")
+
+            # Sorted for display: hierarchy level, then name
+            assert [d.manager_id for d in report.manager_details] == [
+                manager_id for manager_id, figures in sorted(
+                    expected.items(),
+                    key=lambda item: (item[1]["hierarchy_level"], item[1]["manager_name"])
+                )
+            ]
+            print("✓ Managers sorted by hierarchy level, then name")
+
+            # The bucket array lines up with the details and the bucket order
+            buckets = db.query(DistributionBucket).order_by(DistributionBucket.sort_order).all()
+            assert report.bucket_names == [bucket.name for bucket in buckets]
+            assert report.bucket_min_pcts.tolist() == [bucket.min_percentage for bucket in buckets]
+            assert report.bucket_max_pcts.tolist() == [bucket.max_percentage for bucket in buckets]
+            assert report.bucket_pcts.shape == (len(expected), len(buckets))
+            for row, detail in zip(report.bucket_pcts.tolist(), report.manager_details):
+                assert row == [
+                    detail.bucket_percentages.get(name, 0.0) for name in report.bucket_names
+                ]
+            print("✓ Bucket percentage array matches the details")
+
+            print("\n" + "="*60)
+            print("HIERARCHY LEVELS")
+            print("="*60)
+            summaries = _expected_hierarchy(expected)
+            assert list(report.hierarchy_summaries) == sorted(summaries)
+            for level, summary in report.hierarchy_summaries.items():
+                assert summary["hierarchy_level"] == level
+                for key, value in summaries[level].items():
+                    assert summary[key] == value, (level, key)
+                print(
+                    f"  Level {level}: {summary['manager_count']} managers, "
+                    f"{summary['total_included_reports']} included reports"
+                )
+            print("✓ Hierarchy level summaries match")
+
+            for associate in db.query(Associate).all():
+                assert calculate_hierarchy_level(db, associate) == _walk_hierarchy_level(associate)
+            print("✓ calculate_hierarchy_level matches for every associate")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    test_manager_distribution()
+    print("\n✓ All manager distribution tests passed!")